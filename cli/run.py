@@ -24,7 +24,7 @@ from pipeline.project import (
     setup_project_dirs,
     validate_image_input,
 )
-from pipeline.steps import PIPELINE_STEPS, done_file, step_completed
+from pipeline.steps import PIPELINE_STEPS, mark_done, step_completed
 from pipeline.exporter import ensure_dense_ply_copy
 
 
@@ -61,32 +61,32 @@ def run_pipeline(
         if step == "init":
             images = validate_image_input(image_path)
             link_images_to_project(images, dirs["images"])
-            done_file(project_path, "init").touch()
+            mark_done(project_path, "init")
             log.info("Init: linked %d images", len(images))
             continue
 
         if step == "feature_extractor":
             cmd = build_feature_extractor_args(project_path, dirs["images"], config)
             run_colmap(cmd, dry_run=dry_run, num_threads=num_threads)
-            done_file(project_path, step).touch()
+            mark_done(project_path, step)
             continue
 
         if step == "matcher":
             cmd = build_matcher_args(project_path, config)
             run_colmap(cmd, dry_run=dry_run, num_threads=num_threads)
-            done_file(project_path, step).touch()
+            mark_done(project_path, step)
             continue
 
         if step == "mapper":
             cmd = build_mapper_args(project_path, config)
             run_colmap(cmd, dry_run=dry_run, num_threads=num_threads)
-            done_file(project_path, step).touch()
+            mark_done(project_path, step)
             continue
 
         if step == "image_undistorter":
             cmd = build_image_undistorter_args(project_path)
             run_colmap(cmd, dry_run=dry_run, num_threads=num_threads)
-            done_file(project_path, step).touch()
+            mark_done(project_path, step)
             continue
 
         if step == "patch_match_stereo":
@@ -94,12 +94,12 @@ def run_pipeline(
             run_colmap(cmd, dry_run=dry_run, num_threads=num_threads)
             cmd_fusion = build_stereo_fusion_args(project_path, config)
             run_colmap(cmd_fusion, dry_run=dry_run, num_threads=num_threads)
-            done_file(project_path, step).touch()
+            mark_done(project_path, step)
             continue
 
         if step == "export":
             ensure_dense_ply_copy(project_path)
-            done_file(project_path, step).touch()
+            mark_done(project_path, step)
             log.info("Export: dense PLY at %s", dirs["dense"] / "fused.ply")
             continue
 
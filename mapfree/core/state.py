@@ -1,14 +1,29 @@
 """
 Workspace state persistence for auto-resume.
-Tracks pipeline step completion and per-chunk progress via .mapfree_state.json.
-Does not know engine output layout; use validation.py for output checks.
+Tracks pipeline step completion and per-chunk progress via .mapfree_state.msgpack
+(MessagePack, when msgpack is installed) or .mapfree_state.json. Legacy JSON state
+files are still read. Does not know engine output layout; use validation.py for output checks.
 """
 import json
+import os
+import struct
+import zlib
 from enum import Enum
 from pathlib import Path
 
 from .config import PIPELINE_STEPS, CHUNK_STEPS
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    # Parses bytes directly and several times faster; errors subclass ValueError like json's
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 class PipelineState(Enum):
     """High-level pipeline execution state."""
@@ -20,7 +35,21 @@ class PipelineState(Enum):
     ERROR = "error"
 
 
-STATE_FILE = ".mapfree_state.json"
+LEGACY_STATE_FILE = ".mapfree_state.json"
+STATE_FILE = ".mapfree_state.msgpack" if msgpack is not None else LEGACY_STATE_FILE
+
+# Set to 1 to also write a human-readable JSON copy next to the MessagePack state.
+ENV_STATE_DEBUG = "MAPFREE_STATE_DEBUG"
+# Set to 0 to skip fsync on state writes (tests, throwaway workspaces).
+ENV_STATE_SYNC = "MAPFREE_STATE_SYNC"
+
+# Integrity trailer appended to MessagePack state: magic + little-endian CRC32 of the payload.
+# Catches corruption that still decodes; files without it (JSON, older versions) are read as-is.
+_CRC_MAGIC = b"MFS1"
+_CRC_TRAILER = struct.Struct("<4sI")
+
+# Linux-only: anonymous file in the target directory, linked in once fully written.
+_O_TMPFILE = getattr(os, "O_TMPFILE", 0)
 
 # Default state: one bool per pipeline step + chunks dict
 DEFAULT_STATE = {step: False for step in PIPELINE_STEPS}
@@ -31,6 +60,96 @@ def _state_path(workspace_path):
     return Path(workspace_path) / STATE_FILE
 
 
+def _decode_state(raw):
+    """Parse state bytes; JSON is recognised by its leading '{', anything else is MessagePack."""
+    if raw.lstrip()[:1] == b"{":
+        return _json_loads(raw)
+    if msgpack is None:
+        raise ValueError("state file is not JSON and msgpack is not installed")
+    return msgpack.unpackb(raw, raw=False)
+
+
+def _seal(payload):
+    return payload + _CRC_TRAILER.pack(_CRC_MAGIC, zlib.crc32(payload))
+
+
+def _unseal(raw):
+    """Strip and verify the CRC trailer; raises ValueError on mismatch. Untrailed data passes through."""
+    if len(raw) >= _CRC_TRAILER.size:
+        magic, crc = _CRC_TRAILER.unpack_from(raw, len(raw) - _CRC_TRAILER.size)
+        if magic == _CRC_MAGIC:
+            payload = raw[:-_CRC_TRAILER.size]
+            if zlib.crc32(payload) != crc:
+                raise ValueError("state file checksum mismatch")
+            return payload
+    return raw
+
+
+def _read_state(workspace_path):
+    """Decoded contents of the current (or legacy JSON) state file; None if there is none."""
+    ws = Path(workspace_path)
+    for name in dict.fromkeys((STATE_FILE, LEGACY_STATE_FILE)):
+        try:
+            raw = (ws / name).read_bytes()
+        except FileNotFoundError:
+            continue
+        return _decode_state(_unseal(raw))
+    return None
+
+
+def _write_fd(fd, payload, sync):
+    view = memoryview(payload)
+    while view:
+        view = view[os.write(fd, view):]
+    if sync:
+        os.fsync(fd)
+
+
+def _link_tmpfile(tmp, payload, sync):
+    """Write payload to an O_TMPFILE in tmp's directory and link it in as tmp; False if unsupported."""
+    if not _O_TMPFILE:
+        return False
+    try:
+        fd = os.open(tmp.parent, _O_TMPFILE | os.O_WRONLY, 0o644)
+    except OSError:
+        return False
+    try:
+        _write_fd(fd, payload, sync)
+        os.link(f"/proc/self/fd/{fd}", tmp)
+    except OSError:
+        return False  # e.g. /proc unavailable; the unlinked file is discarded on close
+    finally:
+        os.close(fd)
+    return True
+
+
+def _write_atomic(path, payload):
+    """Write bytes to a temp file in the same directory and rename it over path.
+
+    Uses O_TMPFILE where available so a crash mid-write leaves no partial file behind;
+    otherwise a named temp file. fsync unless MAPFREE_STATE_SYNC=0.
+    """
+    sync = os.environ.get(ENV_STATE_SYNC, "1") != "0"
+    tmp = path.with_name(f"{path.name}.{os.urandom(4).hex()}.tmp")
+    if not _link_tmpfile(tmp, payload, sync):
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        try:
+            _write_fd(fd, payload, sync)
+        except BaseException:
+            os.close(fd)
+            os.unlink(tmp)
+            raise
+        os.close(fd)
+    try:
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
 def _normalize_chunk(c):
     """Ensure chunk entry has keys from CHUNK_STEPS."""
     if not isinstance(c, dict):
@@ -39,37 +158,47 @@ def _normalize_chunk(c):
 
 
 def load_state(workspace_path):
-    p = _state_path(workspace_path)
-    if p.exists():
-        try:
-            with open(p, "r") as f:
-                data = json.load(f)
-            for k in DEFAULT_STATE:
-                if k not in data:
-                    data[k] = False if k != "chunks" else {}
-            chunks = data.get("chunks")
-            if not isinstance(chunks, dict):
-                chunks = {}
-            # Backward compat: migrate chunk_sparse_done -> chunks
-            legacy = data.get("chunk_sparse_done")
-            if isinstance(legacy, list) and legacy:
-                for name in legacy:
-                    if name and name not in chunks:
-                        chunks[name] = {s: True for s in CHUNK_STEPS}
-                if "chunk_sparse_done" in data:
-                    del data["chunk_sparse_done"]
-            data["chunks"] = {k: _normalize_chunk(v) for k, v in chunks.items()}
-            return data
-        except (json.JSONDecodeError, OSError):
-            pass
-    return dict(DEFAULT_STATE)
+    try:
+        data = _read_state(workspace_path)
+    except (ValueError, OSError):
+        data = None
+    if not isinstance(data, dict):
+        return dict(DEFAULT_STATE)
+    for k in DEFAULT_STATE:
+        if k not in data:
+            data[k] = False if k != "chunks" else {}
+    chunks = data.get("chunks")
+    if not isinstance(chunks, dict):
+        chunks = {}
+    # Backward compat: migrate chunk_sparse_done -> chunks
+    legacy = data.get("chunk_sparse_done")
+    if isinstance(legacy, list) and legacy:
+        for name in legacy:
+            if name and name not in chunks:
+                chunks[name] = {s: True for s in CHUNK_STEPS}
+        if "chunk_sparse_done" in data:
+            del data["chunk_sparse_done"]
+    data["chunks"] = {k: _normalize_chunk(v) for k, v in chunks.items()}
+    return data
 
 
 def save_state(workspace_path, state_dict):
     p = _state_path(workspace_path)
     Path(workspace_path).mkdir(parents=True, exist_ok=True)
-    with open(p, "w") as f:
-        json.dump(state_dict, f, indent=2)
+    if msgpack is None:
+        # Plain JSON (no trailer) so older versions and json.load can still read it
+        _write_atomic(p, json.dumps(state_dict, indent=2).encode())
+        return
+    _write_atomic(p, _seal(msgpack.packb(state_dict, use_bin_type=True)))
+    legacy = p.with_name(LEGACY_STATE_FILE)
+    if os.environ.get(ENV_STATE_DEBUG) == "1":
+        _write_atomic(legacy, json.dumps(state_dict, indent=2).encode())
+    else:
+        # Drop a migrated legacy JSON file so it cannot resurface after reset_state()
+        try:
+            legacy.unlink()
+        except FileNotFoundError:
+            pass
 
 
 def mark_step_done(workspace_path, step_name):
@@ -110,6 +239,8 @@ def mark_chunk_step_done(workspace_path, chunk_name, step_name):
 
 
 def reset_state(workspace_path):
-    p = _state_path(workspace_path)
-    if p.exists():
-        p.unlink()
+    ws = Path(workspace_path)
+    for name in dict.fromkeys((STATE_FILE, LEGACY_STATE_FILE)):
+        p = ws / name
+        if p.exists():
+            p.unlink()
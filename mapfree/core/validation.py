@@ -44,14 +44,15 @@ def sparse_valid(sparse_dir) -> bool:
 
 def dense_valid(dense_path) -> bool:
     """Dense folder has fused.ply (size > 0) and is non-empty."""
-    d = Path(dense_path)
-    fused = d / "fused.ply"
-    if not file_valid(fused):
-        return False
+    # One directory listing; fused.ply present implies the folder is non-empty
     try:
-        return any(d.iterdir())
+        with os.scandir(dense_path) as it:
+            for e in it:
+                if e.name == "fused.ply":
+                    return e.is_file() and e.stat().st_size > 0
     except OSError:
-        return False
+        pass
+    return False
 
 
 def validate_path_allowed(
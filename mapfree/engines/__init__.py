@@ -1,4 +1,12 @@
 from mapfree.core.engine import BaseEngine
-from .colmap_engine import ColmapEngine
 
 __all__ = ["BaseEngine", "ColmapEngine"]
+
+
+def __getattr__(name: str):
+    # Import the COLMAP engine on first use so importing a sibling module
+    # (e.g. mapfree.engines.inspection) does not pull in its import chain.
+    if name == "ColmapEngine":
+        from .colmap_engine import ColmapEngine
+        return ColmapEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
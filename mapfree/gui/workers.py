@@ -154,37 +154,47 @@ class GeometryLoadWorker(QThread):
     Emits progress(0-100) and loadDone(...) or loadFailed(path).
     """
     progress = Signal(int)
-    loadDone = Signal(list, list, list, list, str, bool, int, int)
+    loadDone = Signal(object, object, object, object, str, bool, int, int)
     loadFailed = Signal(str)
 
-    def __init__(self, file_path: str, is_point_cloud: bool):
+    def __init__(self, file_path: str, is_point_cloud: bool, ply=None):
         super().__init__()
         self._path = str(file_path)
         self._is_point_cloud = bool(is_point_cloud)
+        # (data, header) from gl_widget._open_ply when the caller already read the header
+        self._ply = ply
 
     def run(self):
-        from mapfree.viewer.gl_widget import _load_ply, _simplify_for_render
+        import numpy as np
+
+        from mapfree.viewer.gl_widget import (
+            _DEFAULT_COLOR,
+            _has_rows,
+            _load_ply_body,
+            _open_ply,
+            _simplify_for_render,
+        )
         self.progress.emit(10)
-        data = _load_ply(self._path)
+        ply = self._ply if self._ply is not None else _open_ply(self._path)
+        self._ply = None  # do not keep the file mapping alive past the parse
+        data = _load_ply_body(self._path, *ply) if ply is not None else None
         self.progress.emit(40)
-        if not data or not data.get("vertices"):
+        if not data or not _has_rows(data.get("vertices")):
             self.loadFailed.emit(self._path)
             return
         vertices = data["vertices"]
         normals = data.get("normals")
         colors = data.get("colors")
         indices = data.get("indices") if not self._is_point_cloud else None
-        if not colors:
-            colors = [(0.7, 0.7, 0.7)] * len(vertices)
-        if not normals:
-            normals = [(0.0, 1.0, 0.0)] * len(vertices)
+        if not _has_rows(colors):
+            colors = np.broadcast_to(_DEFAULT_COLOR, (len(vertices), 3))
         self.progress.emit(70)
         vertices, normals, colors, indices = _simplify_for_render(
             vertices, normals, colors, indices
         )
         self.progress.emit(95)
         nv = len(vertices)
-        ni = len(indices) if indices else 0
+        ni = len(indices) if _has_rows(indices) else 0
         self.loadDone.emit(
             vertices, normals, colors, indices,
             self._path, self._is_point_cloud, nv, ni
@@ -1,11 +1,5 @@
 """MapFree 3D viewer package — QOpenGLWidget-based viewer."""
 
-from mapfree.viewer.gl_widget import GLWidget, ViewerWidget, set_default_opengl_format
-from mapfree.viewer.camera import Camera
-from mapfree.viewer.scene import Scene
-from mapfree.viewer.geometry_loader import GeometryLoader
-from mapfree.viewer.shader_manager import ShaderManager
-
 __all__ = [
     "GLWidget",
     "ViewerWidget",
@@ -15,3 +9,23 @@ __all__ = [
     "GeometryLoader",
     "ShaderManager",
 ]
+
+# Public name -> submodule. Resolved on first use so the pure-numpy geometry_loader
+# can be imported (e.g. by tests) without PySide6.
+_LAZY = {
+    "GLWidget": "gl_widget",
+    "ViewerWidget": "gl_widget",
+    "set_default_opengl_format": "gl_widget",
+    "Camera": "camera",
+    "Scene": "scene",
+    "GeometryLoader": "geometry_loader",
+    "ShaderManager": "shader_manager",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    return getattr(import_module(f"{__name__}.{module}"), name)
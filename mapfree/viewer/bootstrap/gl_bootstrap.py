@@ -28,15 +28,24 @@ from mapfree.viewer.bootstrap.gl_selector import (
 
 _BACKEND: str | None = None
 
-_CACHE_PATH = Path(os.path.expanduser("~/.config/mapfree/gl_profile.json"))
+_CACHE_PATH: Path | None = None
+
+
+def _cache_path() -> Path:
+    """Resolve ~/.config/mapfree/gl_profile.json on first use and memoize it."""
+    global _CACHE_PATH
+    if _CACHE_PATH is None:
+        _CACHE_PATH = Path(os.path.expanduser("~/.config/mapfree/gl_profile.json"))
+    return _CACHE_PATH
 
 
 def _load_cache() -> dict[str, Any] | None:
     """Load gl_profile.json. Return None on missing or error."""
     try:
-        if not _CACHE_PATH.exists():
+        cache_path = _cache_path()
+        if not cache_path.exists():
             return None
-        text = _CACHE_PATH.read_text(encoding="utf-8")
+        text = cache_path.read_text(encoding="utf-8")
         data = json.loads(text)
         if not isinstance(data, dict):
             return None
@@ -50,8 +59,9 @@ def _load_cache() -> dict[str, Any] | None:
 def _save_cache(capabilities: dict[str, Any]) -> None:
     """Write capabilities to gl_profile.json. No-op on error."""
     try:
-        _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
-        _CACHE_PATH.write_text(json.dumps(capabilities, indent=2), encoding="utf-8")
+        cache_path = _cache_path()
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(capabilities, indent=2), encoding="utf-8")
     except Exception:
         pass
 
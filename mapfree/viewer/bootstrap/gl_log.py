@@ -7,10 +7,18 @@ import os
 from pathlib import Path
 from typing import Any
 
-_LOG_PATH = Path(os.path.expanduser("~/.config/mapfree/gl_bootstrap.log"))
+_LOG_PATH: Path | None = None
 _LOGGER: logging.Logger | None = None
 
 
+def _log_path() -> Path:
+    """Resolve ~/.config/mapfree/gl_bootstrap.log on first use and memoize it."""
+    global _LOG_PATH
+    if _LOG_PATH is None:
+        _LOG_PATH = Path(os.path.expanduser("~/.config/mapfree/gl_bootstrap.log"))
+    return _LOG_PATH
+
+
 def _get_logger() -> logging.Logger:
     global _LOGGER
     if _LOGGER is not None:
@@ -20,8 +28,9 @@ def _get_logger() -> logging.Logger:
     _LOGGER.handlers.clear()
     _LOGGER.propagate = False
     try:
-        _LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-        handler = logging.FileHandler(_LOG_PATH, encoding="utf-8")
+        log_path = _log_path()
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        handler = logging.FileHandler(log_path, encoding="utf-8")
         handler.setLevel(logging.DEBUG)
         handler.setFormatter(logging.Formatter("%(asctime)s %(message)s", datefmt="%Y-%m-%d %H:%M:%S"))
         _LOGGER.addHandler(handler)
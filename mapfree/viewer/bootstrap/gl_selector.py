@@ -4,12 +4,14 @@ Select OpenGL backend from probe result and environment. Returns one of:
   - "software" — use real QOpenGLWidget with QT_OPENGL=software applied
   - "placeholder" — use GLFallbackWidget; do not create GL context
 """
+import functools
 import os
-import re
 from typing import Any
 
 from PySide6.QtGui import QSurfaceFormat
 
+_DIGITS = "0123456789"
+
 
 def _parse_gl_version(version_str: str | None) -> tuple[int, int]:
     """Parse GL_VERSION string to (major, minor). Return (0, 0) if unparseable."""
@@ -17,38 +19,54 @@ def _parse_gl_version(version_str: str | None) -> tuple[int, int]:
         return (0, 0)
     # e.g. "4.5 (Core Profile) Mesa ..." or "3.3.0" or "2.1 Mesa"
     first_token = version_str.strip().split()[0] if version_str else ""
-    match = re.match(r"^(\d+)\.(\d+)", first_token)
-    if match:
-        return (int(match.group(1)), int(match.group(2)))
+    # "MAJOR.MINOR[...]": plain string ops, no regex
+    major, dot, rest = first_token.partition(".")
+    minor = rest[:len(rest) - len(rest.lstrip(_DIGITS))]
+    if dot and minor and major and not major.strip(_DIGITS):
+        return (int(major), int(minor))
     return (0, 0)
 
 
 _FORCE_VERSIONS = ("4.1", "3.3", "3.0", "2.1")
 
+# Depth/stencil/swap are the same for every format we request; copy this and set version/profile
+_FMT_TEMPLATE = QSurfaceFormat()
+_FMT_TEMPLATE.setDepthBufferSize(24)
+_FMT_TEMPLATE.setStencilBufferSize(8)
+_FMT_TEMPLATE.setSwapBehavior(QSurfaceFormat.SwapBehavior.DoubleBuffer)
 
-def format_from_force_version(version: str) -> QSurfaceFormat | None:
-    """
-    Build QSurfaceFormat for MAPFREE_FORCE_GL. version must be "4.1", "3.3", "3.0", or "2.1".
-    Returns None if version is not supported. 4.1 and 3.3 use Core; 3.0 and 2.1 use Compatibility.
-    """
-    if version not in _FORCE_VERSIONS:
-        return None
-    core_versions = ("4.1", "3.3")
-    use_core = version in core_versions
-    major, minor = (int(x) for x in version.split("."))
-    fmt = QSurfaceFormat()
-    fmt.setDepthBufferSize(24)
-    fmt.setStencilBufferSize(8)
+
+def _make_format(major: int, minor: int, use_core: bool) -> QSurfaceFormat:
+    """Copy the template and apply version + Core/Compatibility profile."""
+    fmt = QSurfaceFormat(_FMT_TEMPLATE)
     fmt.setVersion(major, minor)
     fmt.setProfile(
         QSurfaceFormat.OpenGLContextProfile.CoreProfile
         if use_core
         else QSurfaceFormat.OpenGLContextProfile.CompatibilityProfile
     )
-    fmt.setSwapBehavior(QSurfaceFormat.SwapBehavior.DoubleBuffer)
     return fmt
 
 
+def _build_force_format(version: str) -> QSurfaceFormat:
+    """4.1 and 3.3 use Core; 3.0 and 2.1 use Compatibility."""
+    major, minor = (int(x) for x in version.split("."))
+    return _make_format(major, minor, version in ("4.1", "3.3"))
+
+
+# MAPFREE_FORCE_GL only ever selects one of these; built once, handed out as copies
+_FORCE_FORMATS = {v: _build_force_format(v) for v in _FORCE_VERSIONS}
+
+
+def format_from_force_version(version: str) -> QSurfaceFormat | None:
+    """
+    Build QSurfaceFormat for MAPFREE_FORCE_GL. version must be "4.1", "3.3", "3.0", or "2.1".
+    Returns None if version is not supported. 4.1 and 3.3 use Core; 3.0 and 2.1 use Compatibility.
+    """
+    fmt = _FORCE_FORMATS.get(version)
+    return QSurfaceFormat(fmt) if fmt is not None else None
+
+
 def format_profile_summary(fmt: QSurfaceFormat) -> str:
     """Return a short string for logging, e.g. '3.3 Core' or '2.1 Compatibility'."""
     major = fmt.version().majorVersion()
@@ -90,17 +108,7 @@ def choose_surface_format(capabilities: dict[str, Any]) -> QSurfaceFormat:
         use_core = False
         ver_major, ver_minor = 3, 0
 
-    fmt = QSurfaceFormat()
-    fmt.setDepthBufferSize(24)
-    fmt.setStencilBufferSize(8)
-    fmt.setVersion(ver_major, ver_minor)
-    fmt.setProfile(
-        QSurfaceFormat.OpenGLContextProfile.CoreProfile
-        if use_core
-        else QSurfaceFormat.OpenGLContextProfile.CompatibilityProfile
-    )
-    fmt.setSwapBehavior(QSurfaceFormat.SwapBehavior.DoubleBuffer)
-    return fmt
+    return _make_format(ver_major, ver_minor, use_core)
 
 
 def select_backend(
@@ -123,14 +131,35 @@ def select_backend(
       Otherwise           -> "placeholder" (safe default)
     """
     env = env or os.environ
-    if env.get("MAPFREE_NO_OPENGL") == "1":
-        return "placeholder"
+    no_gl = env.get("MAPFREE_NO_OPENGL") == "1"
+    opengl = env.get("MAPFREE_OPENGL") == "1"
     if probe_result is None:
-        if env.get("MAPFREE_OPENGL") == "1":
-            return "software"
+        return _select_backend_cached(False, False, False, no_gl, opengl)
+    return _select_backend_cached(
+        True,
+        bool(probe_result.get("probe_ok")),
+        bool(probe_result.get("software")),
+        no_gl,
+        opengl,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _select_backend_cached(
+    has_probe: bool,
+    probe_ok: bool,
+    software: bool,
+    no_gl: bool,
+    opengl: bool,
+) -> str:
+    """Decision table for select_backend, keyed on the already-extracted flags."""
+    if no_gl:
         return "placeholder"
-    if not probe_result.get("probe_ok"):
+    if not has_probe:
+        return "software" if opengl else "placeholder"
+    if not probe_ok:
         return "placeholder"
-    if env.get("MAPFREE_OPENGL") == "1":
-        return "software" if probe_result.get("software") else "hardware"
-    return "software" if probe_result.get("software") else "hardware"
+    return "software" if software else "hardware"
+
+
+select_backend.cache_clear = _select_backend_cached.cache_clear  # type: ignore[attr-defined]
@@ -30,15 +30,31 @@ class Camera:
         self._elevation_max = math.pi / 2 - 0.01
         # Smooth interpolation for focus (single step, no inertia)
         self._focus_lerp = 0.0  # 0 = no lerp, 1 = done
+        # Cached matrices, recomputed in place; invalidated by the mutators that affect them
+        self._view_cached = QMatrix4x4()
+        self._proj_cached = QMatrix4x4()
+        self._eye_cached = QVector3D()
+        self._eye_dirty = True
+        self._view_dirty = True
+        self._proj_dirty = True
+
+    def _invalidate_view(self) -> None:
+        """Mark eye position and view matrix stale (target/distance/angles changed)."""
+        self._eye_dirty = True
+        self._view_dirty = True
 
     def _eye_position(self) -> QVector3D:
         """Camera position in world space (derived from target, distance, azimuth, elevation)."""
-        d = self._distance
-        az, el = self._azimuth, self._elevation
-        x = d * math.cos(el) * math.sin(az)
-        y = d * math.sin(el)
-        z = d * math.cos(el) * math.cos(az)
-        return self._target + QVector3D(x, y, z)
+        if self._eye_dirty:
+            d = self._distance
+            az, el = self._azimuth, self._elevation
+            cos_el = math.cos(el)
+            x = d * cos_el * math.sin(az)
+            y = d * math.sin(el)
+            z = d * cos_el * math.cos(az)
+            self._eye_cached = self._target + QVector3D(x, y, z)
+            self._eye_dirty = False
+        return self._eye_cached
 
     def set_position(self, x: float, y: float, z: float) -> None:
         """Set camera position in world space (adjusts target and distance to preserve look direction)."""
@@ -49,40 +65,64 @@ class Camera:
             n = diff.normalized()
             self._elevation = math.asin(max(-1, min(1, n.y())))
             self._azimuth = math.atan2(n.x(), n.z())
+        self._invalidate_view()
 
     def set_look_at(self, x: float, y: float, z: float) -> None:
         """Set target point the camera looks at (orbit center)."""
         self._target = QVector3D(x, y, z)
+        self._invalidate_view()
 
     def set_up(self, x: float, y: float, z: float) -> None:
         """Set up vector for the camera."""
         self._up = QVector3D(x, y, z)
+        self._view_dirty = True
 
     def set_fov(self, degrees: float) -> None:
         """Set vertical field of view in degrees."""
         self._fov_deg = max(0.1, min(179, degrees))
+        self._proj_dirty = True
 
     def set_aspect(self, aspect: float) -> None:
         """Set aspect ratio (width / height)."""
         self._aspect = max(0.01, aspect)
+        self._proj_dirty = True
 
     def set_near_far(self, near: float, far: float) -> None:
         """Set near and far clip plane distances."""
         self._near = max(0.001, near)
         self._far = max(self._near + 0.01, far)
+        self._proj_dirty = True
 
     def view_matrix(self) -> QMatrix4x4:
-        """Return the view matrix (world to view space)."""
-        eye = self._eye_position()
-        m = QMatrix4x4()
-        m.lookAt(eye, self._target, self._up)
-        return m
+        """Return the view matrix (world to view space). Shared instance: copy before mutating."""
+        if self._view_dirty:
+            self._view_cached.setToIdentity()
+            self._view_cached.lookAt(self._eye_position(), self._target, self._up)
+            self._view_dirty = False
+        return self._view_cached
 
     def projection_matrix(self) -> QMatrix4x4:
-        """Return the perspective projection matrix."""
-        m = QMatrix4x4()
-        m.perspective(self._fov_deg, self._aspect, self._near, self._far)
-        return m
+        """Return the perspective projection matrix. Shared instance: copy before mutating."""
+        if self._proj_dirty:
+            self._proj_cached.setToIdentity()
+            self._proj_cached.perspective(self._fov_deg, self._aspect, self._near, self._far)
+            self._proj_dirty = False
+        return self._proj_cached
+
+    def fit_sphere(self, center: QVector3D, radius: float) -> None:
+        """Orbit around center at the distance that fits a sphere of radius in the vertical FOV.
+
+        Keeps azimuth/elevation; near/far are scaled to the sphere so depth precision follows the scene.
+        """
+        radius = max(radius, 1e-3)
+        half_fov = math.radians(self._fov_deg) * 0.5
+        self._target = QVector3D(center)
+        self._distance = max(
+            self._min_distance,
+            min(self._max_distance, radius / math.sin(half_fov)),
+        )
+        self.set_near_far(radius * 1e-3, (self._distance + radius) * 10.0)
+        self._invalidate_view()
 
     def reset(self) -> None:
         """Reset camera to default orbit and distance."""
@@ -90,6 +130,7 @@ class Camera:
         self._distance = 10.0
         self._azimuth = 0.0
         self._elevation = 0.3
+        self._invalidate_view()
 
     def orbit(self, delta_azimuth: float, delta_elevation: float, precision_scale: float = 1.0) -> None:
         """Orbit around target. Angles in radians. precision_scale < 1 for Shift+drag (precision orbit)."""
@@ -99,6 +140,7 @@ class Camera:
             self._elevation_min,
             min(self._elevation_max, self._elevation + delta_elevation * scale),
         )
+        self._invalidate_view()
 
     def pan(self, dx: float, dy: float) -> None:
         """Pan: move target in view plane. dx, dy in pixels; scaled by distance."""
@@ -108,6 +150,7 @@ class Camera:
         up = QVector3D.crossProduct(right, forward).normalized()
         scale = self._distance * 0.002
         self._target = self._target + right * (-dx * scale) + up * (dy * scale)
+        self._invalidate_view()
 
     def zoom(self, delta: float) -> None:
         """Zoom in/out (centered on current target). Positive delta = zoom in."""
@@ -116,6 +159,7 @@ class Camera:
             self._min_distance,
             min(self._max_distance, self._distance * factor),
         )
+        self._invalidate_view()
 
     def zoom_toward_pivot(self, pivot_world: QVector3D, delta: float) -> None:
         """
@@ -132,6 +176,7 @@ class Camera:
         new_distance = max(self._min_distance, min(self._max_distance, self._distance * factor))
         self._target = eye + to_pivot.normalized() * new_distance
         self._distance = new_distance
+        self._invalidate_view()
 
     def focus_on_point(self, world_point: QVector3D, smooth: bool = True) -> None:
         """
@@ -142,10 +187,11 @@ class Camera:
             self._target = world_point
         else:
             self._target = QVector3D(world_point)
+        self._invalidate_view()
 
     def eye_position(self) -> QVector3D:
         """Current camera position in world space."""
-        return self._eye_position()
+        return QVector3D(self._eye_position())
 
     def target(self) -> QVector3D:
         """Current look-at target (orbit center)."""
@@ -3,39 +3,171 @@
 Uses pure Python + numpy only (no laspy/lazy loading or other heavy deps).
 """
 
+import mmap
+import struct
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
 
-def _ensure_float32_3(arr: np.ndarray | None, n: int, default: tuple[float, float, float]) -> np.ndarray:
-    """Return (n, 3) float32; create from default if arr is None or wrong shape."""
-    if arr is not None and arr.shape == (n, 3):
-        return np.asarray(arr, dtype=np.float32)
-    out = np.empty((n, 3), dtype=np.float32)
-    out[:] = default
-    return out
+def _map_file(path: Path) -> mmap.mmap | bytes:
+    """Map a file read-only so pages load lazily instead of copying it into a bytes object.
+
+    The mapping is released when the last reference (including numpy views) goes away.
+    Empty files cannot be mapped; b"" is returned for them.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return b""
+    # Bodies are decoded front to back; let the kernel read ahead aggressively (POSIX only)
+    if hasattr(mmap, "MADV_SEQUENTIAL"):
+        mm.madvise(mmap.MADV_SEQUENTIAL)
+    return mm
+
+
+# Defaults for attributes a file does not provide; broadcast into the VBO, never materialized per vertex
+_DEFAULT_NORMAL = (0.0, 1.0, 0.0)
+_DEFAULT_COLOR = (0.7, 0.7, 0.7)
+
+
+def _rows_or_none(arr: Any, n: int) -> np.ndarray | None:
+    """Return arr as (n, 3) float32, or None if missing/empty/wrong shape (caller uses the default)."""
+    if arr is None or not len(arr):
+        return None
+    arr = np.asarray(arr, dtype=np.float32)
+    return arr if arr.shape == (n, 3) else None
+
+
+# One interleaved vertex: [x,y,z, r,g,b, nx,ny,nz], 36 bytes, matches the VBO layout
+_VBO_DTYPE = np.dtype([("pos", "<f4", (3,)), ("col", "<f4", (3,)), ("nrm", "<f4", (3,))])
+
+
+def _alloc_vbo(n: int) -> np.ndarray:
+    """Allocate an uninitialised (n,) structured VBO; loaders fill 'pos'/'col'/'nrm' in place."""
+    return np.empty(n, dtype=_VBO_DTYPE)
+
+
+def _vbo_as_float32(vbo: np.ndarray) -> np.ndarray:
+    """View a structured VBO as (N, 9) float32 for glBufferData (no copy)."""
+    return vbo.view(np.float32).reshape(len(vbo), 9)
 
 
 def _build_vbo_interleaved(
     positions: np.ndarray,
-    colors: np.ndarray,
-    normals: np.ndarray,
+    colors: np.ndarray | None = None,
+    normals: np.ndarray | None = None,
 ) -> np.ndarray:
-    """Build interleaved VBO: [x,y,z, r,g,b, nx,ny,nz] per vertex, (N, 9) float32."""
-    n = len(positions)
-    vbo = np.empty((n, 9), dtype=np.float32)
-    vbo[:, 0:3] = positions
-    vbo[:, 3:6] = colors
-    vbo[:, 6:9] = normals
-    return vbo
+    """Build interleaved VBO: [x,y,z, r,g,b, nx,ny,nz] per vertex, (N, 9) float32.
+
+    Missing colors/normals are filled by broadcasting the module defaults.
+    """
+    vbo = _alloc_vbo(len(positions))
+    vbo["pos"] = positions
+    vbo["col"] = _DEFAULT_COLOR if colors is None else colors
+    vbo["nrm"] = _DEFAULT_NORMAL if normals is None else normals
+    return _vbo_as_float32(vbo)
+
+
+def _pad_polygons(polys: list[list[int]], fill: int = -1) -> tuple[np.ndarray, np.ndarray]:
+    """Pack variable-length polygons into a (F, K) int64 array padded with fill, plus per-row counts."""
+    counts = np.fromiter((len(p) for p in polys), dtype=np.int64, count=len(polys))
+    k = int(counts.max()) if len(counts) else 0
+    padded = np.full((len(polys), k), fill, dtype=np.int64)
+    for row, poly in enumerate(polys):
+        padded[row, :len(poly)] = poly
+    return padded, counts
+
+
+def _fan_triangulate(faces: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Fan-triangulate padded polygons (F, K[, ...]) with per-row vertex counts.
+
+    Triangle k of a face is (v0, vk, vk+1); returns (T, 3[, ...]) in face-major order.
+    """
+    f, k = faces.shape[:2]
+    if k < 3:
+        return np.empty((0, 3) + faces.shape[2:], dtype=faces.dtype)
+    tris = np.stack(
+        (np.broadcast_to(faces[:, :1], faces[:, 1:-1].shape), faces[:, 1:-1], faces[:, 2:]),
+        axis=2,
+    )
+    valid = np.arange(2, k)[None, :] < counts[:, None]
+    return tris[valid]
 
 
 # -----------------------------------------------------------------------------
 # PLY
 # -----------------------------------------------------------------------------
 
+# Upper bound on header size searched for end_header (headers are a few hundred bytes)
+_PLY_MAX_HEADER_BYTES = 1 << 20
+
+# PLY scalar property type -> numpy type code (byte order added per file)
+_PLY_SCALAR_TYPES = {
+    "char": "i1", "int8": "i1",
+    "uchar": "u1", "uint8": "u1",
+    "short": "i2", "int16": "i2",
+    "ushort": "u2", "uint16": "u2",
+    "int": "i4", "int32": "i4",
+    "uint": "u4", "uint32": "u4",
+    "float": "f4", "float32": "f4",
+    "double": "f8", "float64": "f8",
+}
+
+# Rows converted per batch when packing the binary vertex block (keeps the touched mapping window small)
+_PLY_VERTEX_BATCH = 1 << 18
+
+# Precompiled index-list unpackers for the binary face loop, keyed by (byte order, n)
+_PLY_FACE_STRUCTS: dict[tuple[str, int], struct.Struct] = {
+    (bo, n): struct.Struct(f"{bo}{n}i") for bo in "<>" for n in (3, 4)
+}
+
+
+_INV_255 = np.float32(1.0 / 255.0)
+
+
+def _normalize_colors(colors: np.ndarray) -> np.ndarray:
+    """Scale float colors to 0-1 in place if the file stores them as 0-255 (decided once per file)."""
+    if len(colors) and colors.max() > 1.0:
+        colors *= _INV_255
+    return colors
+
+
+def _ascii_vertex_columns(lines: list[str], usecols: list[int]) -> np.ndarray:
+    """Convert the used columns of ASCII vertex rows to float32, one row per vertex.
+
+    Well-formed blocks go through np.loadtxt in one call; if any row is short or non-numeric,
+    falls back to a per-row pass that skips just those rows.
+    """
+    if not lines:
+        return np.empty((0, len(usecols)), dtype=np.float32)
+    try:
+        return np.loadtxt(lines, dtype=np.float32, usecols=usecols, ndmin=2)
+    except ValueError:
+        pass
+    need = max(usecols) + 1
+    rows = []
+    for ln in lines:
+        tok = ln.split()
+        if len(tok) < need:
+            continue
+        try:
+            rows.append([float(tok[c]) for c in usecols])
+        except ValueError:
+            continue
+    return np.array(rows, dtype=np.float32).reshape(-1, len(usecols))
+
+
+def _ply_face_struct(byte_order: str, n: int) -> struct.Struct:
+    """Return the cached unpacker for n int32 face indices (built on first use for large n)."""
+    st = _PLY_FACE_STRUCTS.get((byte_order, n))
+    if st is None:
+        st = _PLY_FACE_STRUCTS[(byte_order, n)] = struct.Struct(f"{byte_order}{n}i")
+    return st
+
+
 def load_ply(file_path: str) -> dict[str, Any] | None:
     """Load a PLY file. Returns dict with VBO-ready arrays or None on failure.
 
@@ -50,7 +182,7 @@ def load_ply(file_path: str) -> dict[str, Any] | None:
     path = Path(file_path)
     if not path.exists() or path.suffix.lower() != ".ply":
         return None
-    data = path.read_bytes()
+    data = _map_file(path)
     try:
         out = _parse_ply(data)
     except Exception:
@@ -58,19 +190,17 @@ def load_ply(file_path: str) -> dict[str, Any] | None:
     if out is None or len(out["vertices"]) == 0:
         return None
 
-    vertices = np.array(out["vertices"], dtype=np.float32)
+    vertices = np.asarray(out["vertices"], dtype=np.float32)
     n = len(vertices)
-    normals = _ensure_float32_3(
-        np.array(out["normals"], dtype=np.float32) if out.get("normals") else None,
-        n, (0.0, 1.0, 0.0),
-    )
-    colors = _ensure_float32_3(
-        np.array(out["colors"], dtype=np.float32) if out.get("colors") else None,
-        n, (0.7, 0.7, 0.7),
-    )
-    indices = np.array(out["indices"], dtype=np.uint32) if out.get("indices") else None
+    indices = np.asarray(out["indices"], dtype=np.uint32) if out.get("indices") is not None else None
 
-    vbo = _build_vbo_interleaved(vertices, colors, normals)
+    vbo = _build_vbo_interleaved(
+        vertices,
+        _rows_or_none(out.get("colors"), n),
+        _rows_or_none(out.get("normals"), n),
+    )
+    colors = vbo[:, 3:6]
+    normals = vbo[:, 6:9]
     return {
         "positions": vertices,
         "normals": normals,
@@ -81,14 +211,69 @@ def load_ply(file_path: str) -> dict[str, Any] | None:
     }
 
 
-def _parse_ply(data: bytes) -> dict[str, Any] | None:
-    import struct
-    text = data.decode("utf-8", errors="replace")
-    lines = [s.strip() for s in text.splitlines()]
-    if not lines or lines[0].lower() != "ply":
+def _read_ply_header(data: bytes | mmap.mmap) -> tuple[list[str], int] | None:
+    """Scan the header one line at a time; return (stripped lines, body offset) or None.
+
+    Stops at the end_header line, so the body starts exactly after its newline (a binary body
+    whose first byte is 0x0A/0x0D is not skipped). Bounded by _PLY_MAX_HEADER_BYTES.
+    """
+    limit = min(len(data), _PLY_MAX_HEADER_BYTES)
+    lines = []
+    pos = 0
+    while pos < limit:
+        nl = data.find(b"\n", pos, limit)
+        end = limit if nl < 0 else nl
+        line = data[pos:end].decode("ascii", errors="replace").strip()
+        lines.append(line)
+        pos = end + 1
+        if line == "end_header":
+            return lines, min(pos, len(data))
+    return None
+
+
+def _ply_triangle_faces(
+    data: bytes | mmap.mmap, offset: int, num_faces: int, byte_order: str
+) -> np.ndarray | None:
+    """Decode an all-triangle binary face block (uchar 3 + 3 int32 per face) in one np.frombuffer.
+
+    Returns flat int32 indices, or None if any face is not a triangle (caller uses the per-face loop).
+    """
+    if num_faces <= 0 or offset >= len(data) or data[offset] != 3:
+        return None
+    face_dtype = np.dtype([("n", "u1"), ("i", byte_order + "i4", (3,))])
+    count = min(num_faces, (len(data) - offset) // face_dtype.itemsize)
+    faces = np.frombuffer(data, dtype=face_dtype, count=count, offset=offset)
+    if not (faces["n"] == 3).all():
+        return None
+    return faces["i"].reshape(-1)
+
+
+def _parse_ply(data: bytes | mmap.mmap) -> dict[str, Any] | None:
+    """Parse a whole PLY (header, then body); None if it is not a PLY with vertex x/y/z."""
+    header = _parse_ply_header(data)
+    if header is None:
+        return None
+    return _parse_ply_body(data, header)
+
+
+def _parse_ply_header(data: bytes | mmap.mmap) -> dict[str, Any] | None:
+    """Parse only the PLY header: format, counts, vertex layout and body offset.
+
+    Cheap enough for the GUI thread; the body is decoded separately by _parse_ply_body.
+    Returns None if the data is not a PLY or has no vertex x/y/z.
+    """
+    # Only the header is decoded; the body is read straight from the buffer.
+    if data[:16].lstrip()[:3].lower() != b"ply":
+        return None
+    scanned = _read_ply_header(data)
+    if scanned is None:
+        return None
+    lines, body_start = scanned
+    if lines[0].lower() != "ply":
         return None
 
     fmt = "ascii"
+    byte_order = "<"
     num_vertices = 0
     num_faces = 0
     vertex_props = []
@@ -99,6 +284,7 @@ def _parse_ply(data: bytes) -> dict[str, Any] | None:
         i += 1
         if line.startswith("format "):
             fmt = "ascii" if "ascii" in line.lower() else "binary"
+            byte_order = ">" if "big_endian" in line.lower() else "<"
         elif line.startswith("element vertex "):
             num_vertices = int(line.split()[-1])
             current_element = "vertex"
@@ -126,86 +312,118 @@ def _parse_ply(data: bytes) -> dict[str, Any] | None:
     if v_x < 0 or v_y < 0 or v_z < 0:
         return None
 
+    return {
+        "fmt": fmt,
+        "byte_order": byte_order,
+        "num_vertices": num_vertices,
+        "num_faces": num_faces,
+        "vertex_props": vertex_props,
+        "body_start": body_start,
+        "cols": (v_x, v_y, v_z, v_nx, v_ny, v_nz, v_r, v_g, v_b),
+    }
+
+
+def _parse_ply_body(data: bytes | mmap.mmap, header: dict[str, Any]) -> dict[str, Any]:
+    """Decode the vertex and face blocks described by a _parse_ply_header result."""
+    fmt = header["fmt"]
+    byte_order = header["byte_order"]
+    num_vertices = header["num_vertices"]
+    num_faces = header["num_faces"]
+    vertex_props = header["vertex_props"]
+    body_start = header["body_start"]
+    v_x, v_y, v_z, v_nx, v_ny, v_nz, v_r, v_g, v_b = header["cols"]
+
     vertices = []
     normals = [] if (v_nx >= 0 and v_ny >= 0 and v_nz >= 0) else None
     colors = [] if (v_r >= 0 and v_g >= 0 and v_b >= 0) else None
 
-    header_end = data.find(b"end_header")
-    if header_end < 0:
-        return None
-    header_end += len(b"end_header")
-    while header_end < len(data) and data[header_end:header_end + 1] in (b"\n", b"\r"):
-        header_end += 1
-
     if fmt == "ascii":
-        ascii_body = data[header_end:].decode("utf-8", errors="replace")
-        ascii_lines = [ln.split() for ln in ascii_body.splitlines() if ln.strip()]
-        line_idx = 0
-        for _ in range(num_vertices):
-            if line_idx >= len(ascii_lines):
-                break
-            tok = ascii_lines[line_idx]
-            line_idx += 1
-            if len(tok) <= max(v_x, v_y, v_z):
-                continue
-            x, y, z = float(tok[v_x]), float(tok[v_y]), float(tok[v_z])
-            vertices.append((x, y, z))
-            if normals is not None and len(tok) > v_nz:
-                normals.append((float(tok[v_nx]), float(tok[v_ny]), float(tok[v_nz])))
-            if colors is not None and len(tok) > v_b:
-                r, g, b = float(tok[v_r]), float(tok[v_g]), float(tok[v_b])
-                if r > 1 or g > 1 or b > 1:
-                    r, g, b = r / 255.0, g / 255.0, b / 255.0
-                colors.append((r, g, b))
-        indices = []
-        for _ in range(num_faces):
-            if line_idx >= len(ascii_lines):
-                break
-            tok = ascii_lines[line_idx]
-            line_idx += 1
+        ascii_body = data[body_start:].decode("utf-8", errors="replace")
+        ascii_lines = [ln for ln in ascii_body.splitlines() if ln.strip()]
+        vertex_lines = ascii_lines[:num_vertices]
+        # Whole vertex block parsed in C; only the columns actually used are converted
+        usecols = [v_x, v_y, v_z]
+        if normals is not None:
+            usecols += [v_nx, v_ny, v_nz]
+        if colors is not None:
+            usecols += [v_r, v_g, v_b]
+        arr = _ascii_vertex_columns(vertex_lines, usecols)
+        vertices = arr[:, 0:3]
+        col = 3
+        if normals is not None:
+            normals = arr[:, col:col + 3]
+            col += 3
+        if colors is not None:
+            colors = _normalize_colors(arr[:, col:col + 3])
+        polys = []
+        for ln in ascii_lines[len(vertex_lines):len(vertex_lines) + num_faces]:
+            tok = ln.split()
             if len(tok) < 4:
                 continue
             n = int(tok[0])
-            if n == 3:
-                indices.extend([int(tok[1]), int(tok[2]), int(tok[3])])
-            elif n == 4:
-                indices.extend([int(tok[1]), int(tok[2]), int(tok[3]), int(tok[1]), int(tok[3]), int(tok[4])])
+            if n >= 3:
+                polys.append([int(t) for t in tok[1:n + 1]])
+        indices = _fan_triangulate(*_pad_polygons(polys)).ravel() if polys else []
     else:
-        vertex_stride = 4 * len(vertex_props)
-        offset = header_end
-        for _ in range(num_vertices):
-            if offset + vertex_stride > len(data):
-                break
-            floats = struct.unpack_from(f"{len(vertex_props)}f", data, offset)
-            offset += vertex_stride
-            vertices.append((float(floats[v_x]), float(floats[v_y]), float(floats[v_z])))
-            if normals is not None:
-                normals.append((float(floats[v_nx]), float(floats[v_ny]), float(floats[v_nz])))
-            if colors is not None:
-                r, g, b = floats[v_r], floats[v_g], floats[v_b]
-                if r > 1 or g > 1 or b > 1:
-                    r, g, b = r / 255.0, g / 255.0, b / 255.0
-                colors.append((r, g, b))
-        indices = []
-        for _ in range(num_faces):
-            if offset >= len(data):
-                break
-            n = struct.unpack_from("B", data, offset)[0]
-            offset += 1
-            if n >= 3 and offset + n * 4 <= len(data):
-                idxs = struct.unpack_from(f"{n}i", data, offset)
-                offset += n * 4
-                if n == 3:
-                    indices.extend(idxs)
-                else:
-                    for k in range(1, n - 1):
-                        indices.extend([idxs[0], idxs[k], idxs[k + 1]])
+        # One structured view over the vertex block, typed per declared property
+        try:
+            vertex_dtype = np.dtype([
+                (f"p{idx}", byte_order + _PLY_SCALAR_TYPES[ptype])
+                for idx, (_, ptype) in enumerate(vertex_props)
+            ])
+        except KeyError:
+            return None  # list-typed or unknown vertex property
+        count = min(num_vertices, (len(data) - body_start) // vertex_dtype.itemsize)
+        rec = np.frombuffer(data, dtype=vertex_dtype, count=count, offset=body_start)
+        offset = body_start + count * vertex_dtype.itemsize
+
+        # Pack every used column into one float32 array in a single front-to-back pass over the
+        # mapping, batch by batch, instead of re-walking the whole block once per column
+        usecols = [v_x, v_y, v_z]
+        if normals is not None:
+            usecols += [v_nx, v_ny, v_nz]
+        if colors is not None:
+            usecols += [v_r, v_g, v_b]
+        arr = np.empty((count, len(usecols)), dtype=np.float32)
+        for start in range(0, count, _PLY_VERTEX_BATCH):
+            batch = rec[start:start + _PLY_VERTEX_BATCH]
+            dst = arr[start:start + len(batch)]
+            for col, idx in enumerate(usecols):
+                dst[:, col] = batch[f"p{idx}"]
+        vertices = arr[:, 0:3]
+        col = 3
+        if normals is not None:
+            normals = arr[:, col:col + 3]
+            col += 3
+        if colors is not None:
+            colors = arr[:, col:col + 3]
+            if vertex_dtype[f"p{v_r}"].kind in "iu":
+                colors *= _INV_255
+            else:
+                colors = _normalize_colors(colors)
+        # Triangulated meshes decode in one pass; polygons (or mixed) fall back to the per-face loop
+        indices = _ply_triangle_faces(data, offset, num_faces, byte_order)
+        if indices is None:
+            indices = []
+            for _ in range(num_faces):
+                if offset >= len(data):
+                    break
+                n = data[offset]  # uchar count: indexing yields an int, no tuple
+                offset += 1
+                if n >= 3 and offset + n * 4 <= len(data):
+                    idxs = _ply_face_struct(byte_order, n).unpack_from(data, offset)
+                    offset += n * 4
+                    if n == 3:
+                        indices.extend(idxs)
+                    else:
+                        for k in range(1, n - 1):
+                            indices.extend([idxs[0], idxs[k], idxs[k + 1]])
 
     return {
         "vertices": vertices,
         "normals": normals,
         "colors": colors,
-        "indices": indices if indices else None,
+        "indices": indices if len(indices) else None,
     }
 
 
@@ -223,12 +441,11 @@ def load_las(file_path: str) -> dict[str, Any] | None:
     if not path.exists() or path.suffix.lower() not in (".las", ".las1", ".las2"):
         return None
     try:
-        data = path.read_bytes()
+        data = _map_file(path)
     except Exception:
         return None
     if len(data) < 227:
         return None
-    import struct
     # Public header block (little-endian)
     sig = data[0:4]
     if sig != b"LASF":
@@ -239,42 +456,51 @@ def load_las(file_path: str) -> dict[str, Any] | None:
     num_points = struct.unpack_from("<I", data, 107)[0]
     scale = struct.unpack_from("<ddd", data, 131)
     offset_xyz = struct.unpack_from("<ddd", data, 155)
-    if offset_to_point + num_points * point_record_length > len(data):
-        num_points = (len(data) - offset_to_point) // max(1, point_record_length)
+    # Validate the header before sizing any arrays: a corrupt num_points must not drive allocation
+    if point_record_length < 12 or not 227 <= offset_to_point <= len(data):
+        return None
+    num_points = min(num_points, (len(data) - offset_to_point) // point_record_length)
     # Point format 0: 20 bytes. 1: 28 bytes (+GPS). 2: 26 bytes (+RGB at 20). 3: 34 bytes (+GPS + RGB at 28)
     has_rgb = point_format in (2, 3) and point_record_length >= 26
     rgb_offset = 20 if point_format == 2 else 28 if point_format == 3 else 0
     if has_rgb and point_record_length < rgb_offset + 6:
         has_rgb = False
 
-    xs = np.empty(num_points, dtype=np.float64)
-    ys = np.empty(num_points, dtype=np.float64)
-    zs = np.empty(num_points, dtype=np.float64)
+    # One structured view over all point records; itemsize skips the unused fields
+    names = ["x", "y", "z"]
+    formats = ["<i4", "<i4", "<i4"]
+    offsets = [0, 4, 8]
     if has_rgb:
-        rs = np.empty(num_points, dtype=np.uint16)
-        gs = np.empty(num_points, dtype=np.uint16)
-        bs = np.empty(num_points, dtype=np.uint16)
-
-    base = offset_to_point
-    for i in range(num_points):
-        o = base + i * point_record_length
-        if o + 12 > len(data):
-            break
-        x, y, z = struct.unpack_from("<iii", data, o)
-        xs[i] = x * scale[0] + offset_xyz[0]
-        ys[i] = y * scale[1] + offset_xyz[1]
-        zs[i] = z * scale[2] + offset_xyz[2]
-        if has_rgb and o + rgb_offset + 6 <= len(data):
-            rs[i], gs[i], bs[i] = struct.unpack_from("<HHH", data, o + rgb_offset)
+        names += ["r", "g", "b"]
+        formats += ["<u2", "<u2", "<u2"]
+        offsets += [rgb_offset, rgb_offset + 2, rgb_offset + 4]
+    point_dtype = np.dtype({
+        "names": names,
+        "formats": formats,
+        "offsets": offsets,
+        "itemsize": point_record_length,
+    })
+    rec = np.frombuffer(data, dtype=point_dtype, count=num_points, offset=offset_to_point)
 
     n = num_points
-    positions = np.column_stack((xs, ys, zs)).astype(np.float32)
-    normals = np.full((n, 3), (0.0, 1.0, 0.0), dtype=np.float32)
+    # Decode straight into the interleaved VBO; positions/colors/normals are views into it
+    vbo_rec = _alloc_vbo(n)
+    positions = vbo_rec["pos"]
+    colors = vbo_rec["col"]
+    normals = vbo_rec["nrm"]
+    # Scale + offset straight into float32 (no float64 xs/ys/zs temporaries)
+    for axis, field in enumerate(("x", "y", "z")):
+        col = positions[:, axis]
+        np.multiply(rec[field], np.float32(scale[axis]), out=col, casting="unsafe")
+        col += np.float32(offset_xyz[axis])
+    normals[:] = _DEFAULT_NORMAL
     if has_rgb:
-        colors = np.column_stack((rs / 65535.0, gs / 65535.0, bs / 65535.0)).astype(np.float32)
+        inv = np.float32(1.0 / 65535.0)
+        for axis, field in enumerate(("r", "g", "b")):
+            np.multiply(rec[field], inv, out=colors[:, axis], casting="unsafe")
     else:
-        colors = np.full((n, 3), 0.7, dtype=np.float32)
-    vbo = _build_vbo_interleaved(positions, colors, normals)
+        colors[:] = _DEFAULT_COLOR
+    vbo = _vbo_as_float32(vbo_rec)
     return {
         "positions": positions,
         "normals": normals,
@@ -289,6 +515,18 @@ def load_las(file_path: str) -> dict[str, Any] | None:
 # OBJ
 # -----------------------------------------------------------------------------
 
+def _parse_obj_xyz(lines: list[bytes]) -> np.ndarray:
+    """Parse 'v'/'vn' lines to (N, 3) float32 in one np.loadtxt call; lines with < 3 values are dropped."""
+    if not lines:
+        return np.empty((0, 3), dtype=np.float32)
+    try:
+        return np.loadtxt(lines, usecols=(1, 2, 3), dtype=np.float32, ndmin=2)
+    except ValueError:
+        # Malformed rows (too few values): fall back to per-line parsing
+        rows = [p[1:4] for p in (ln.split() for ln in lines) if len(p) >= 4]
+        return np.array(rows, dtype=np.float32).reshape(-1, 3)
+
+
 def load_obj(file_path: str) -> dict[str, Any] | None:
     """Load an OBJ mesh. Returns dict with VBO-ready arrays or None.
 
@@ -299,75 +537,77 @@ def load_obj(file_path: str) -> dict[str, Any] | None:
     if not path.exists() or path.suffix.lower() != ".obj":
         return None
     try:
-        text = path.read_text(encoding="utf-8", errors="replace")
+        raw = _map_file(path)
     except Exception:
         return None
+    if not raw:
+        return None
 
-    v_list = []
-    vn_list = []
-    vt_list = []
-    faces = []  # list of (v_indices, vn_indices, vt_indices) per face
-
-    for line in text.splitlines():
+    # Classify lines by prefix only; numeric rows are parsed in bulk below
+    v_lines = []
+    vn_lines = []
+    f_lines = []
+    for line in iter(raw.readline, b""):
         line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        parts = line.split()
-        if parts[0] == "v":
-            if len(parts) >= 4:
-                v_list.append((float(parts[1]), float(parts[2]), float(parts[3])))
-        elif parts[0] == "vn":
-            if len(parts) >= 4:
-                vn_list.append((float(parts[1]), float(parts[2]), float(parts[3])))
-        elif parts[0] == "vt":
-            if len(parts) >= 3:
-                vt_list.append((float(parts[1]), float(parts[2])))
-        elif parts[0] == "f":
-            # f v1/vt1/vn1 v2/vt2/vn2 v3/vt3/vn3 [v4/...]
-            face_verts = []
-            for i in range(1, len(parts)):
-                segs = parts[i].split("/")
-                vi = int(segs[0]) - 1 if (segs and segs[0].strip()) else -1
-                vti = int(segs[1]) - 1 if (len(segs) > 1 and segs[1].strip()) else -1
-                vni = int(segs[2]) - 1 if (len(segs) > 2 and segs[2].strip()) else -1
-                face_verts.append((vi, vni, vti))
-            # Triangulate polygon
-            for k in range(1, len(face_verts) - 1):
-                faces.append((face_verts[0], face_verts[k], face_verts[k + 1]))
-
-    if not v_list:
+        if line.startswith((b"v ", b"v\t")):
+            v_lines.append(line)
+        elif line.startswith((b"vn ", b"vn\t")):
+            vn_lines.append(line)
+        elif line.startswith((b"f ", b"f\t")):
+            f_lines.append(line)
+
+    v_arr = _parse_obj_xyz(v_lines)
+    vn_arr = _parse_obj_xyz(vn_lines)
+    faces_v = []
+    faces_vn = []
+    for line in f_lines:
+        parts = line.decode("utf-8", errors="replace").split()
+        # f v1/vt1/vn1 v2/vt2/vn2 v3/vt3/vn3 [v4/...]
+        face_v = []
+        face_vn = []
+        for i in range(1, len(parts)):
+            segs = parts[i].split("/")
+            face_v.append(int(segs[0]) - 1 if (segs and segs[0].strip()) else -1)
+            face_vn.append(int(segs[2]) - 1 if (len(segs) > 2 and segs[2].strip()) else -1)
+        faces_v.append(face_v)
+        faces_vn.append(face_vn)
+
+    if not len(v_arr):
         return None
 
-    # Build unique vertex key (v, vn, vt) -> index for expanded vertex array
-    v_to_idx = {}
-    positions = []
-    normals = []
-    indices = []
-    default_n = (0.0, 1.0, 0.0)
-    nv = len(v_list)
-    nn = len(vn_list)
-
-    for face in faces:
-        for v_idx, vn_idx, _ in face:
-            if v_idx < 0 or v_idx >= nv:
-                continue
-            key = (v_idx, vn_idx if 0 <= vn_idx < nn else -1)
-            if key not in v_to_idx:
-                idx = len(positions)
-                v_to_idx[key] = idx
-                positions.append(v_list[v_idx])
-                normals.append(vn_list[vn_idx] if 0 <= vn_idx < nn else default_n)
-            indices.append(v_to_idx[key])
-
-    if not positions:
+    nv = len(v_arr)
+    nn = len(vn_arr)
+    # Fan-triangulate (v, vn) pairs together; corners come out 3 per triangle
+    padded_v, counts = _pad_polygons(faces_v)
+    padded_vn, _ = _pad_polygons(faces_vn)
+    corners = _fan_triangulate(np.stack((padded_v, padded_vn), axis=2), counts).reshape(-1, 2)
+    corner_v = corners[:, 0].copy()
+    corner_vn = corners[:, 1].copy()
+    keep = (corner_v >= 0) & (corner_v < nv)
+    corner_v = corner_v[keep]
+    corner_vn = corner_vn[keep]
+    corner_vn[(corner_vn < 0) | (corner_vn >= nn)] = -1
+    if not len(corner_v):
         return None
 
-    positions = np.array(positions, dtype=np.float32)
-    normals = np.array(normals, dtype=np.float32)
-    n = len(positions)
-    colors = np.full((n, 3), 0.7, dtype=np.float32)
-    indices = np.array(indices, dtype=np.uint32)
-    vbo = _build_vbo_interleaved(positions, colors, normals)
+    # Unique (v, vn) pairs -> expanded vertices, numbered in first-use order
+    keys = corner_v * (nn + 1) + (corner_vn + 1)
+    uniq, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+    order = np.argsort(first, kind="stable")
+    rank = np.empty(len(uniq), dtype=np.int64)
+    rank[order] = np.arange(len(uniq))
+    uniq = uniq[order]
+    indices = rank[inverse.ravel()]
+
+    positions = v_arr[uniq // (nn + 1)]
+    vbo = _build_vbo_interleaved(positions)
+    colors = vbo[:, 3:6]
+    normals = vbo[:, 6:9]
+    nrm_src = uniq % (nn + 1) - 1
+    has_n = nrm_src >= 0
+    if has_n.any():
+        normals[has_n] = vn_arr[nrm_src[has_n]]
+    indices = indices.astype(np.uint32)
     return {
         "positions": positions,
         "normals": normals,
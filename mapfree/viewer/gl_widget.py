@@ -22,16 +22,24 @@ Viewer responsibilities only:
 Viewer does NOT: process PDAL, DTM, measurement logic — all in backend engine.
 """
 
+import ctypes
+import io
 import logging
+import mmap
 import os
-import struct
 from pathlib import Path
 from typing import Any
 
-from PySide6.QtOpenGLWidgets import QOpenGLWidget
+import numpy as np
 
-_log = logging.getLogger("mapfree.viewer.gl_widget")
+from PySide6.QtOpenGLWidgets import QOpenGLWidget
 from mapfree.viewer.camera import Camera
+from mapfree.viewer.geometry_loader import (
+    _map_file,
+    _parse_ply_body,
+    _parse_ply_header,
+)
+from mapfree.viewer.shader_manager import _uniform_locations, shared_shader_manager
 from PySide6.QtGui import QSurfaceFormat, QOpenGLContext, QMatrix4x4
 from PySide6.QtOpenGL import (
     QOpenGLBuffer,
@@ -45,6 +53,14 @@ from PySide6.QtCore import Qt, QSize, QPoint, QRect, Signal
 from PySide6.QtGui import QWheelEvent, QMouseEvent, QKeyEvent
 from PySide6.QtGui import QVector3D
 
+try:
+    import pyminiply
+    _PYMINIPLY_AVAILABLE = True
+except ImportError:
+    _PYMINIPLY_AVAILABLE = False
+
+_log = logging.getLogger("mapfree.viewer.gl_widget")
+
 # OpenGL constants (not all exposed on QOpenGLFunctions_3_3_Core in PySide6)
 GL_COLOR_BUFFER_BIT = 0x00004000
 GL_DEPTH_BUFFER_BIT = 0x00000100
@@ -56,8 +72,10 @@ GL_TRIANGLES = 0x0004
 GL_LINES = 0x0001
 GL_LINE_STRIP = 0x0003
 GL_POINTS = 0x0000
+GL_UNSIGNED_SHORT = 0x1403
 GL_UNSIGNED_INT = 0x1405
 GL_DYNAMIC_DRAW = 0x88E8
+GL_PROGRAM_POINT_SIZE = 0x8642
 
 # Safe memory: cap vertex count per batch to avoid UI freeze / OOM
 MAX_VERTICES_RENDER = 2_000_000
@@ -65,6 +83,11 @@ MAX_VERTICES_RENDER = 2_000_000
 MAX_SAFE_VERTICES = 2_000_000
 # Above this count we auto-downsample for preview; full resolution only for export
 LARGE_MESH_VERTEX_THRESHOLD = 10_000_000
+# Buffer uploads at least this large are written through a mapped range instead of glBufferData
+MAPPED_UPLOAD_MIN_BYTES = 32 * 1024 * 1024
+# Per-vertex default when the PLY has no colors (broadcast, never materialized per vertex).
+# Missing normals are not filled in: meshes without them use derivative normals on the GPU.
+_DEFAULT_COLOR = np.array((0.7, 0.7, 0.7), dtype=np.float32)
 
 # -----------------------------------------------------------------------------
 # PLY loader (custom, no external deps)
@@ -72,16 +95,16 @@ LARGE_MESH_VERTEX_THRESHOLD = 10_000_000
 
 
 def _simplify_for_render(
-    vertices: list,
-    normals: list | None,
-    colors: list,
-    indices: list | None,
+    vertices: np.ndarray,
+    normals: np.ndarray | None,
+    colors: np.ndarray,
+    indices: np.ndarray | None,
     max_vertices: int | None = None,
 ):
     """
     Auto-downsample for large meshes: when vertex count > max_vertices, subsample to LOD preview.
     Default max_vertices = MAX_VERTICES_RENDER. Used for render LOD and for Mesh Buffer Guard (MAX_SAFE_VERTICES).
-    Returns (v, n, c, ind).
+    Returns (v, n, c, ind) as float32 arrays (ind uint32 or None).
     """
     cap = max_vertices if max_vertices is not None else MAX_VERTICES_RENDER
     n = len(vertices)
@@ -89,193 +112,150 @@ def _simplify_for_render(
         return vertices, normals, colors, indices
     # Uniformly sample to at most cap (LOD preview; full res only for export)
     step = max(1, n // cap)
-    kept_idx = list(range(0, n, step))[:cap]
-    kept_set = set(kept_idx)
-    old_to_new = {old: i for i, old in enumerate(kept_idx)}
-    new_vertices = [vertices[i] for i in kept_idx]
-    new_normals = [normals[i] for i in kept_idx] if normals else None
-    new_colors = [colors[i] for i in kept_idx]
-    if indices and len(indices) >= 3:
-        new_indices = []
-        for i in range(0, len(indices), 3):
-            a, b, c = indices[i], indices[i + 1], indices[i + 2]
-            if a in kept_set and b in kept_set and c in kept_set:
-                new_indices.extend([old_to_new[a], old_to_new[b], old_to_new[c]])
-        if not new_indices:
-            new_indices = None
-    else:
-        new_indices = None
+    kept_idx = np.arange(0, n, step)[:cap]
+    new_vertices = np.asarray(vertices, dtype=np.float32)[kept_idx]
+    new_normals = np.asarray(normals, dtype=np.float32)[kept_idx] if _has_rows(normals) else None
+    new_colors = np.asarray(colors, dtype=np.float32)[kept_idx]
+    new_indices = None
+    if indices is not None and len(indices) >= 3:
+        # old -> new vertex index, -1 for dropped; keep triangles whose three corners all survive
+        old_to_new = np.full(n, -1, dtype=np.int64)
+        old_to_new[kept_idx] = np.arange(len(kept_idx))
+        tris = np.asarray(indices, dtype=np.int64)[: len(indices) // 3 * 3].reshape(-1, 3)
+        tris = tris[((tris >= 0) & (tris < n)).all(axis=1)]
+        tris = old_to_new[tris]
+        tris = tris[(tris >= 0).all(axis=1)]
+        if len(tris):
+            new_indices = tris.astype(np.uint32).ravel()
     return new_vertices, new_normals, new_colors, new_indices
 
 
-def _load_ply(file_path: str) -> dict[str, Any] | None:
+# In-memory PLY sources accepted by load_mesh/load_point_cloud besides a file path
+_PLY_BUFFER_TYPES = (bytes, bytearray, io.BytesIO)
+
+
+def _ply_source_name(source: Any) -> str:
+    """Label used in signals/logs: the path, or "<memory>" for an in-memory PLY."""
+    return "<memory>" if isinstance(source, _PLY_BUFFER_TYPES) else str(source)
+
+
+def _load_ply(file_path: str | os.PathLike | bytes | bytearray | io.BytesIO) -> dict[str, Any] | None:
+    """
+    Load a PLY file (or in-memory PLY bytes). Returns a dict with:
+      vertices: (N, 3) float32 array
+      normals: (N, 3) float32 array or None
+      colors: (N, 3) float32 array in 0-1 or None
+      indices: triangle indices (3 per face) or None for point cloud
     """
-    Load a PLY file. Returns a dict with:
-      vertices: list of (x,y,z) floats
-      normals: list of (nx,ny,nz) or None
-      colors: list of (r,g,b) in 0-1 float or None
-      indices: list of int (triangles, 3 per face) or None for point cloud
+    ply = _open_ply(file_path)
+    if ply is None:
+        return None
+    return _load_ply_body(file_path, *ply)
+
+
+def _open_ply(
+    file_path: str | os.PathLike | bytes | bytearray | io.BytesIO,
+) -> tuple[mmap.mmap | bytes, dict[str, Any]] | None:
+    """Map a PLY and parse only its header; (data, header) or None if it is not a loadable PLY.
+
+    Cheap (the body is not touched), so async loads run it on the GUI thread and hand the
+    result to the worker, which decodes the body with _load_ply_body. bytes/BytesIO are
+    parsed in place without touching the filesystem.
     """
-    path = Path(file_path)
-    if not path.exists() or path.suffix.lower() != ".ply":
+    if isinstance(file_path, _PLY_BUFFER_TYPES):
+        data = file_path.getvalue() if isinstance(file_path, io.BytesIO) else file_path
+    else:
+        path = Path(file_path)
+        if not path.exists() or path.suffix.lower() != ".ply":
+            return None
+        try:
+            # Read-only mapping: pages load on demand and np.frombuffer views it without a copy
+            data = _map_file(path)
+        except Exception:
+            return None
+    try:
+        header = _parse_ply_header(data)
+    except Exception:
         return None
-    data = path.read_bytes()
+    if header is None:
+        return None
+    return data, header
+
+
+def _load_ply_body(file_path: Any, data: mmap.mmap | bytes, header: dict[str, Any]) -> dict[str, Any] | None:
+    """Decode the PLY body for a header from _open_ply (pyminiply when installed). None on failure."""
+    if _PYMINIPLY_AVAILABLE and not isinstance(file_path, _PLY_BUFFER_TYPES):
+        try:
+            return _load_ply_miniply(Path(file_path))
+        except Exception as e:
+            _log.debug("pyminiply failed on %s (%s); using built-in parser.", file_path, e)
     try:
-        return _parse_ply(data)
+        return _parse_ply_body(data, header)
     except Exception:
         return None
 
 
-def _parse_ply(data: bytes) -> dict[str, Any]:
-    """Parse PLY binary or ASCII. Fills vertices, optional normals/colors, optional face indices."""
-    text = data.decode("utf-8", errors="replace")
-    lines = [s.strip() for s in text.splitlines()]
-    if not lines or lines[0].lower() != "ply":
-        raise ValueError("Not a PLY file")
-
-    # Parse header
-    fmt = "ascii"
-    binary_fmt = "little"
-    num_vertices = 0
-    num_faces = 0
-    vertex_props = []  # (name, type_str)
-    face_props = []
-    i = 1
-    while i < len(lines):
-        line = lines[i]
-        i += 1
-        if line.startswith("format "):
-            parts = line.split()
-            if parts[1].lower() == "ascii":
-                fmt = "ascii"
-            else:
-                fmt = "binary"
-                binary_fmt = "little" if (len(parts) > 2 and "little" in line.lower()) else "big"  # noqa: F841
-        elif line.startswith("element vertex "):
-            num_vertices = int(line.split()[-1])
-        elif line.startswith("element face "):
-            num_faces = int(line.split()[-1])
-        elif line.startswith("property "):
-            parts = line.split()
-            if len(parts) >= 3:
-                prop_type, prop_name = parts[1], parts[2]
-                if "vertex" in lines[i - 2].lower():
-                    vertex_props.append((prop_name.lower(), prop_type))
-                elif "face" in lines[i - 2].lower():
-                    face_props.append((prop_name.lower(), prop_type, parts))
-        elif line == "end_header":
-            break
-
-    # Build vertex property indices
-    v_x = v_y = v_z = v_nx = v_ny = v_nz = v_r = v_g = v_b = -1
-    for idx, (name, _) in enumerate(vertex_props):
-        if name == "x": v_x = idx
-        elif name == "y": v_y = idx
-        elif name == "z": v_z = idx
-        elif name == "nx": v_nx = idx
-        elif name == "ny": v_ny = idx
-        elif name == "nz": v_nz = idx
-        elif name in ("red", "r"): v_r = idx
-        elif name in ("green", "g"): v_g = idx
-        elif name in ("blue", "b"): v_b = idx
-    if v_x < 0 or v_y < 0 or v_z < 0:
-        raise ValueError("PLY missing vertex x,y,z")
-
-    vertices = []
-    normals = [] if (v_nx >= 0 and v_ny >= 0 and v_nz >= 0) else None
-    colors = [] if (v_r >= 0 and v_g >= 0 and v_b >= 0) else None
-
-    header_end = data.find(b"end_header")
-    if header_end < 0:
-        header_end = text.find("end_header")
-        if header_end >= 0:
-            header_end = len(text[:header_end].encode("utf-8"))
-        else:
-            raise ValueError("No end_header")
-    header_end += len(b"end_header")
-    # Skip newline after end_header
-    while header_end < len(data) and data[header_end:header_end + 1] in (b"\n", b"\r"):
-        header_end += 1
-    if fmt == "ascii":
-        header_end = data.find(b"\n", header_end)
-        if header_end >= 0:
-            header_end += 1
-        ascii_body = data[header_end:].decode("utf-8", errors="replace")
-        ascii_lines = [ln.split() for ln in ascii_body.splitlines() if ln.strip()]
-        line_idx = 0
-        for _ in range(num_vertices):
-            if line_idx >= len(ascii_lines):
-                break
-            tok = ascii_lines[line_idx]
-            line_idx += 1
-            if len(tok) <= max(v_x, v_y, v_z):
-                continue
-            x = float(tok[v_x])
-            y = float(tok[v_y])
-            z = float(tok[v_z])
-            vertices.append((x, y, z))
-            if normals is not None and len(tok) > v_nz:
-                normals.append((float(tok[v_nx]), float(tok[v_ny]), float(tok[v_nz])))
-            if colors is not None and len(tok) > v_b:
-                r, g, b = float(tok[v_r]), float(tok[v_g]), float(tok[v_b])
-                if r > 1 or g > 1 or b > 1:
-                    r, g, b = r / 255.0, g / 255.0, b / 255.0
-                colors.append((r, g, b))
+def _load_ply_miniply(path: Path) -> dict[str, Any]:
+    """Load a PLY with the optional pyminiply C++ reader; same dict layout as _load_ply_body."""
+    vertices, faces, normals, _uv, colors = pyminiply.read(str(path))
+    vertices = np.asarray(vertices, dtype=np.float32)
+    if not len(vertices):
+        raise ValueError("PLY has no vertices")
+    normals = np.asarray(normals, dtype=np.float32) if len(normals) else None
+    if len(colors):
+        is_int = colors.dtype.kind in "iu"
+        colors = colors.astype(np.float32)
+        if is_int or colors.max() > 1.0:
+            colors /= 255.0
     else:
-        # Binary: assume float for vertex props, read tightly
-        vertex_stride = 4 * len(vertex_props)  # assume float32 per property
-        offset = header_end
-        for _ in range(num_vertices):
-            if offset + vertex_stride > len(data):
-                break
-            # Assume all vertex properties are float
-            floats = struct.unpack_from(f"{len(vertex_props)}f", data, offset)
-            offset += vertex_stride
-            vertices.append((float(floats[v_x]), float(floats[v_y]), float(floats[v_z])))
-            if normals is not None:
-                normals.append((float(floats[v_nx]), float(floats[v_ny]), float(floats[v_nz])))
-            if colors is not None:
-                r, g, b = floats[v_r], floats[v_g], floats[v_b]
-                if r > 1 or g > 1 or b > 1:
-                    r, g, b = r / 255.0, g / 255.0, b / 255.0
-                colors.append((r, g, b))
-
-    indices = []
-    if num_faces > 0 and fmt == "ascii":
-        for _ in range(num_faces):
-            if line_idx >= len(ascii_lines):
-                break
-            tok = ascii_lines[line_idx]
-            line_idx += 1
-            if len(tok) < 4:
-                continue
-            n = int(tok[0])
-            if n == 3:
-                indices.extend([int(tok[1]), int(tok[2]), int(tok[3])])
-            elif n == 4:
-                indices.extend([int(tok[1]), int(tok[2]), int(tok[3]), int(tok[1]), int(tok[3]), int(tok[4])])
-    elif num_faces > 0 and fmt == "binary":
-        offset = header_end + num_vertices * vertex_stride
-        for _ in range(num_faces):
-            if offset >= len(data):
-                break
-            n = struct.unpack_from("B", data, offset)[0]
-            offset += 1
-            if n >= 3 and offset + n * 4 <= len(data):
-                idxs = struct.unpack_from(f"{n}i", data, offset)
-                offset += n * 4
-                if n == 3:
-                    indices.extend(idxs)
-                else:
-                    for k in range(1, n - 1):
-                        indices.extend([idxs[0], idxs[k], idxs[k + 1]])
+        colors = None
+    indices = np.asarray(faces, dtype=np.uint32).reshape(-1) if len(faces) else None
+    return {"vertices": vertices, "normals": normals, "colors": colors, "indices": indices}
+
+
+def _write_buffer(buf: QOpenGLBuffer, arr: np.ndarray) -> None:
+    """Fill a bound buffer with arr: glBufferSubData when the size is unchanged, else reallocate.
 
-    return {
-        "vertices": vertices,
-        "normals": normals,
-        "colors": colors,
-        "indices": indices if indices else None,
-    }
+    The array's memory is handed to Qt directly (buffer protocol); no intermediate bytes copy.
+    Large arrays go through a mapped write instead (see _write_buffer_mapped).
+    """
+    arr = np.ascontiguousarray(arr)
+    if arr.nbytes >= MAPPED_UPLOAD_MIN_BYTES and _write_buffer_mapped(buf, arr):
+        return
+    if buf.size() == arr.nbytes:
+        buf.write(0, arr, arr.nbytes)
+    else:
+        buf.allocate(arr, arr.nbytes)
+
+
+def _write_buffer_mapped(buf: QOpenGLBuffer, arr: np.ndarray) -> bool:
+    """Copy arr straight into driver memory through an invalidating write-only mapping.
+
+    Invalidating orphans the old store, so the copy does not wait for draws still using it, and the
+    driver skips the staging copy glBufferData makes. Returns False if mapping is unavailable, the
+    copy failed or the store was lost on unmap; the caller then falls back to a plain allocate.
+    """
+    if buf.size() != arr.nbytes:
+        buf.allocate(arr.nbytes)
+    access = QOpenGLBuffer.RangeAccessFlag.RangeWrite | QOpenGLBuffer.RangeAccessFlag.RangeInvalidateBuffer
+    ptr = buf.mapRange(0, arr.nbytes, access)
+    # mapRange returns a shiboken VoidPtr: ctypes only takes its integer address, and truth-testing
+    # a VoidPtr without a size raises
+    addr = int(ptr) if ptr is not None else 0
+    if not addr:
+        return False
+    try:
+        ctypes.memmove(addr, arr.ctypes.data, arr.nbytes)
+    except Exception as e:
+        buf.unmap()
+        _log.debug("Mapped buffer upload failed (%s); using allocate.", e)
+        return False
+    return buf.unmap()
+
+
+def _has_rows(arr) -> bool:
+    """True if arr (list or ndarray) is present and non-empty."""
+    return arr is not None and len(arr) > 0
 
 
 # -----------------------------------------------------------------------------
@@ -314,62 +294,11 @@ def _format_fallback_21() -> QSurfaceFormat:
 # Shaders
 # -----------------------------------------------------------------------------
 
-_VERTEX_SHADER = """
-#version 330 core
-layout(location = 0) in vec3 aPos;
-layout(location = 1) in vec3 aColor;
-layout(location = 2) in vec3 aNormal;
-out vec3 vColor;
-out vec3 vNormal;
-uniform mat4 uProjection;
-uniform mat4 uView;
-uniform mat4 uModel;
-void main() {
-    gl_Position = uProjection * uView * uModel * vec4(aPos, 1.0);
-    vColor = aColor;
-    vNormal = mat3(transpose(inverse(uModel))) * aNormal;
-}
-"""
-
-_FRAGMENT_SHADER = """
-#version 330 core
-in vec3 vColor;
-in vec3 vNormal;
-out vec4 FragColor;
-void main() {
-    vec3 N = normalize(vNormal);
-    vec3 L = normalize(vec3(0.2, 0.5, 0.8));
-    float diff = max(dot(N, L), 0.0);
-    vec3 ambient = 0.4 * vColor;
-    vec3 diffuse = 0.6 * diff * vColor;
-    FragColor = vec4(ambient + diffuse, 1.0);
-}
-"""
-
-# Fallback when no normals (point cloud)
-_VERTEX_SHADER_POINTS = """
-#version 330 core
-layout(location = 0) in vec3 aPos;
-layout(location = 1) in vec3 aColor;
-out vec3 vColor;
-uniform mat4 uProjection;
-uniform mat4 uView;
-uniform mat4 uModel;
-void main() {
-    gl_Position = uProjection * uView * uModel * vec4(aPos, 1.0);
-    gl_PointSize = 2.0;
-    vColor = aColor;
-}
-"""
-
-_FRAGMENT_SHADER_POINTS = """
-#version 330 core
-in vec3 vColor;
-out vec4 FragColor;
-void main() {
-    FragColor = vec4(vColor, 1.0);
-}
-"""
+# Mesh and point-cloud programs come from the shared ShaderManager (shader_manager.py).
+# Fixed key light for the mesh program: L = normalize(-uLightDir)
+_MESH_LIGHT_DIR = (-0.2, -0.5, -0.8)
+_MESH_AMBIENT = (0.4, 0.4, 0.4)
+_MESH_DIFFUSE = (0.6, 0.6, 0.6)
 
 # Overlay: lines (position only, uniform color)
 _LINE_VERTEX_SHADER = """
@@ -406,7 +335,9 @@ class ViewerWidget(QOpenGLWidget):
     geometry_load_failed = Signal(str)  # path when async load failed
     progressChanged = Signal(int)  # 0-100 during async geometry load (for progress bar)
 
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, headless: bool = False):
+        """headless=True never creates a GL context: loads parse and count geometry but upload nothing
+        (tests and tools that only need the loaded data; do not show() such a widget)."""
         fmt = QSurfaceFormat()
         fmt.setVersion(3, 3)
         fmt.setProfile(QSurfaceFormat.OpenGLContextProfile.CoreProfile)
@@ -426,17 +357,35 @@ class ViewerWidget(QOpenGLWidget):
         self._program_points = None
         self._num_vertices = 0
         self._num_indices = 0
+        self._index_gl_type = GL_UNSIGNED_INT  # GL_UNSIGNED_SHORT when the EBO holds uint16
+        # Scene bounds (set on load, used by zoom_fit)
+        self._bbox_min = self._bbox_max = self._center = None
+        self._radius = 0.0
         self._initialized = False
-        self._use_fallback = False  # True when 3.3 Core failed → 2.1 compat path
+        self._headless = headless
+        self._use_fallback = headless  # True when 3.3 Core failed → 2.1 compat path (or headless)
         self._camera = Camera()
         self._last_mouse = QPoint()
         self._mouse_button = Qt.MouseButton.NoButton
         self._show_axes = False
         self._tool_manager = None
         self._program_line = None
+        self._program_mesh_flat = None  # mesh without normals: face normals from dFdx/dFdy
+        self._mesh_locs = self._mesh_flat_locs = self._points_locs = self._line_locs = {}
+        self._vbo_has_normals = True  # VAO layout: 36-byte stride with normals, 24 without
+        self._use_derivative_normals = False
         self._vao_line = None
         self._vbo_line = None
         self._geometry_load_worker = None
+        self._is_streaming = False  # True only for geometry rewritten every frame (DynamicDraw buffers)
+        self._scratch: np.ndarray | None = None  # float32 interleave buffer reused across uploads
+        self._index_scratch: np.ndarray | None = None  # raw bytes for EBO index conversion, reused likewise
+        self._set_model_matrix(_identity())
+
+    def _set_model_matrix(self, model: QMatrix4x4) -> None:
+        """Set the scene model matrix and its normal matrix (recomputed here, not per vertex)."""
+        self._model = model
+        self._normal_matrix = model.normalMatrix()
 
     def _glf(self):
         """Return OpenGL functions; must be called with context current."""
@@ -444,6 +393,8 @@ class ViewerWidget(QOpenGLWidget):
 
     def initializeGL(self) -> None:
         """Guard against context loss: try init_renderer (3.3 Core), else fallback_mode (2.1 compat)."""
+        if self._headless:
+            return
         if os.environ.get("MAPFREE_NO_OPENGL") == "1":
             _log.warning("MAPFREE_NO_OPENGL=1: skipping OpenGL initialization.")
             self._use_fallback = True
@@ -479,6 +430,8 @@ class ViewerWidget(QOpenGLWidget):
         if not self._gl or not self._gl.initializeOpenGLFunctions():
             self._gl = None
             raise RuntimeError("OpenGL 3.3 Core not available")
+        # Let the points shader's gl_PointSize take effect (ignored by some drivers otherwise); set once
+        self._gl.glEnable(GL_PROGRAM_POINT_SIZE)
         self._create_shaders()
         self._create_buffers()
 
@@ -488,6 +441,7 @@ class ViewerWidget(QOpenGLWidget):
         self._gl = None
         self._vao = self._vbo = self._ebo = None
         self._program_mesh = self._program_points = self._program_line = None
+        self._program_mesh_flat = None
         self._vao_line = self._vbo_line = None
         if exc is not None:
             _log.warning(
@@ -506,17 +460,19 @@ class ViewerWidget(QOpenGLWidget):
             _log.warning("QOpenGLFunctions init failed in fallback mode: %s", inner)
 
     def _create_shaders(self) -> None:
-        self._program_mesh = QOpenGLShaderProgram()
-        self._program_mesh.addShaderFromSourceCode(QOpenGLShader.Vertex, _VERTEX_SHADER)
-        self._program_mesh.addShaderFromSourceCode(QOpenGLShader.Fragment, _FRAGMENT_SHADER)
-        if not self._program_mesh.link():
-            raise RuntimeError("Mesh shader link failed: " + self._program_mesh.log())
-
-        self._program_points = QOpenGLShaderProgram()
-        self._program_points.addShaderFromSourceCode(QOpenGLShader.Vertex, _VERTEX_SHADER_POINTS)
-        self._program_points.addShaderFromSourceCode(QOpenGLShader.Fragment, _FRAGMENT_SHADER_POINTS)
-        if not self._program_points.link():
-            raise RuntimeError("Points shader link failed: " + self._program_points.log())
+        # Mesh/points programs are compiled once per GL share group and reused by every viewer in it
+        sm = shared_shader_manager()
+        if sm is None:
+            raise RuntimeError("Mesh/points shader compile or link failed")
+        self._program_mesh = sm.mesh_program()
+        self._program_mesh_flat = sm.mesh_flat_program()
+        self._program_points = sm.point_cloud_program()
+        for prog in (self._program_mesh, self._program_mesh_flat):
+            prog.bind()
+            prog.setUniformValue("uLightDir", QVector3D(*_MESH_LIGHT_DIR))
+            prog.setUniformValue("uAmbientColor", QVector3D(*_MESH_AMBIENT))
+            prog.setUniformValue("uDiffuseColor", QVector3D(*_MESH_DIFFUSE))
+            prog.release()
 
         self._program_line = QOpenGLShaderProgram()
         self._program_line.addShaderFromSourceCode(QOpenGLShader.Vertex, _LINE_VERTEX_SHADER)
@@ -524,6 +480,15 @@ class ViewerWidget(QOpenGLWidget):
         if not self._program_line.link():
             raise RuntimeError("Line shader link failed: " + self._program_line.log())
 
+        # Resolve uniform locations once per link; paintGL sets uniforms by location
+        mesh_uniforms = ("uProjection", "uView", "uModel", "uNormalMatrix", "uCameraPosition")
+        self._mesh_locs = _uniform_locations(self._program_mesh, mesh_uniforms)
+        self._mesh_flat_locs = _uniform_locations(self._program_mesh_flat, mesh_uniforms)
+        self._points_locs = _uniform_locations(
+            self._program_points, ("uProjection", "uView", "uModel", "uCameraPosition")
+        )
+        self._line_locs = _uniform_locations(self._program_line, ("uProjection", "uView", "uColor"))
+
     def _create_buffers(self) -> None:
         self._vao = QOpenGLVertexArrayObject()
         self._vbo = QOpenGLBuffer(QOpenGLBuffer.Type.VertexBuffer)
@@ -532,10 +497,18 @@ class ViewerWidget(QOpenGLWidget):
         self._vbo.create()
         self._ebo.create()
         self._vao.bind()
-        self._vbo.setUsage(QOpenGLBuffer.UsagePattern.DynamicDraw)
-        self._ebo.setUsage(QOpenGLBuffer.UsagePattern.DynamicDraw)
+        # Scene geometry is uploaded once per load and then only drawn; streamed data uses DynamicDraw
+        usage = (
+            QOpenGLBuffer.UsagePattern.DynamicDraw
+            if self._is_streaming
+            else QOpenGLBuffer.UsagePattern.StaticDraw
+        )
+        self._vbo.setUsage(usage)
+        self._ebo.setUsage(usage)
         self._vbo.bind()
         self._ebo.bind()
+        # Recorded once in the VAO; reloads only rewrite the buffer contents
+        self._set_vertex_layout(with_normals=True)
         self._vao.release()
         self._vbo.release()
         self._ebo.release()
@@ -546,24 +519,38 @@ class ViewerWidget(QOpenGLWidget):
         self._vbo_line.create()
         self._vbo_line.setUsage(QOpenGLBuffer.UsagePattern.DynamicDraw)
 
+    def _set_vertex_layout(self, with_normals: bool) -> None:
+        """Record attribute pointers in the bound VAO (VBO bound): 0=pos(3), 1=color(3)[, 2=normal(3)].
+
+        Stride is 36 bytes with normals, 24 without; the layout only changes when that choice does.
+        """
+        g = self._gl
+        stride = (9 if with_normals else 6) * 4
+        g.glEnableVertexAttribArray(0)
+        g.glVertexAttribPointer(0, 3, GL_FLOAT, GL_FALSE, stride, 0)
+        g.glEnableVertexAttribArray(1)
+        g.glVertexAttribPointer(1, 3, GL_FLOAT, GL_FALSE, stride, 3 * 4)
+        if with_normals:
+            g.glEnableVertexAttribArray(2)
+            g.glVertexAttribPointer(2, 3, GL_FLOAT, GL_FALSE, stride, 6 * 4)
+        else:
+            g.glDisableVertexAttribArray(2)
+        self._vbo_has_normals = with_normals
+
     def resizeGL(self, w: int, h: int) -> None:
-        self.makeCurrent()
+        # Qt makes the context current around resizeGL/paintGL; no makeCurrent/doneCurrent here
         if w > 0 and h > 0:
             self._camera.set_aspect(w / h)
         if self._gl:
             self._gl.glViewport(0, 0, w, h)
-        self.doneCurrent()
 
     def paintGL(self) -> None:
-        self.makeCurrent()
         if not self._gl:
-            self.doneCurrent()
             return
         g = self._gl
         g.glClearColor(0.15, 0.15, 0.15, 1.0)
         g.glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         if self._use_fallback:
-            self.doneCurrent()
             return
         g.glEnable(GL_DEPTH_TEST)
 
@@ -571,33 +558,38 @@ class ViewerWidget(QOpenGLWidget):
             proj = self._camera.projection_matrix()
             view = self._camera.view_matrix()
             eye = self._camera.eye_position()
-            model = _identity()
+            model = self._model
             self._vao.bind()
             if self._num_indices > 0:
-                self._program_mesh.bind()
-                self._program_mesh.setUniformValue("uProjection", proj)
-                self._program_mesh.setUniformValue("uView", view)
-                self._program_mesh.setUniformValue("uModel", model)
-                self._program_mesh.setUniformValue("uCameraPosition", eye)
-                g.glDrawElements(GL_TRIANGLES, self._num_indices, GL_UNSIGNED_INT, None)
+                if self._use_derivative_normals:
+                    prog, locs = self._program_mesh_flat, self._mesh_flat_locs
+                else:
+                    prog, locs = self._program_mesh, self._mesh_locs
+                prog.bind()
+                prog.setUniformValue(locs["uProjection"], proj)
+                prog.setUniformValue(locs["uView"], view)
+                prog.setUniformValue(locs["uModel"], model)
+                prog.setUniformValue(locs["uNormalMatrix"], self._normal_matrix)
+                prog.setUniformValue(locs["uCameraPosition"], eye)
+                g.glDrawElements(GL_TRIANGLES, self._num_indices, self._index_gl_type, None)
             else:
-                self._program_points.bind()
-                self._program_points.setUniformValue("uProjection", proj)
-                self._program_points.setUniformValue("uView", view)
-                self._program_points.setUniformValue("uModel", model)
-                self._program_points.setUniformValue("uCameraPosition", eye)
+                prog, locs = self._program_points, self._points_locs
+                prog.bind()
+                prog.setUniformValue(locs["uProjection"], proj)
+                prog.setUniformValue(locs["uView"], view)
+                prog.setUniformValue(locs["uModel"], model)
+                prog.setUniformValue(locs["uCameraPosition"], eye)
                 g.glDrawArrays(GL_POINTS, 0, self._num_vertices)
             self._vao.release()
         if self._tool_manager is not None:
             self._tool_manager.draw_overlay(self)
-        self.doneCurrent()
 
     def get_camera_matrices(self) -> dict:
         """Return projection, view, and viewport for ray/overlay. No GL state change."""
         w, h = max(1, self.width()), max(1, self.height())
         return {
-            "projection": self._camera.projection_matrix(),
-            "view": self._camera.view_matrix(),
+            "projection": QMatrix4x4(self._camera.projection_matrix()),
+            "view": QMatrix4x4(self._camera.view_matrix()),
             "viewport": (0, 0, w, h),
             "width": w,
             "height": h,
@@ -665,12 +657,11 @@ class ViewerWidget(QOpenGLWidget):
         self._vbo_line.allocate(data, len(data))
         g.glEnableVertexAttribArray(0)
         g.glVertexAttribPointer(0, 3, GL_FLOAT, GL_FALSE, 12, 0)
+        locs = self._line_locs
         self._program_line.bind()
-        self._program_line.setUniformValue(
-            "uProjection", self._camera.projection_matrix()
-        )
-        self._program_line.setUniformValue("uView", self._camera.view_matrix())
-        self._program_line.setUniformValue("uColor", QVector3D(color[0], color[1], color[2]))
+        self._program_line.setUniformValue(locs["uProjection"], self._camera.projection_matrix())
+        self._program_line.setUniformValue(locs["uView"], self._camera.view_matrix())
+        self._program_line.setUniformValue(locs["uColor"], QVector3D(color[0], color[1], color[2]))
         g.glDrawArrays(GL_LINES, 0, len(segments) * 2)
         g.glDisableVertexAttribArray(0)
         self._vbo_line.release()
@@ -708,10 +699,10 @@ class ViewerWidget(QOpenGLWidget):
 
     def _on_geometry_load_done(
         self,
-        vertices: list,
-        normals: list,
-        colors: list,
-        indices: list | None,
+        vertices: np.ndarray,
+        normals: np.ndarray | None,
+        colors: np.ndarray,
+        indices: np.ndarray | None,
         path: str,
         is_point_cloud: bool,
         num_vertices: int,
@@ -720,13 +711,14 @@ class ViewerWidget(QOpenGLWidget):
         """Called from main thread when GeometryLoadWorker finishes. Upload to GPU and update."""
         self._geometry_load_worker = None
         self.progressChanged.emit(100)
+        self._set_scene_bounds(vertices)
         if self._use_fallback:
             self._num_vertices = num_vertices
             self._num_indices = num_indices
             self.update()
             self.mesh_loaded.emit(path, num_vertices)
             return
-        if indices:
+        if _has_rows(indices):
             self._upload_geometry(vertices, normals, colors, indices=indices)
             self._num_indices = num_indices
         else:
@@ -742,131 +734,193 @@ class ViewerWidget(QOpenGLWidget):
         self.geometry_load_failed.emit(path)
 
     def load_mesh_async(self, file_path: str) -> bool:
-        """Start loading a PLY mesh in background thread; progress via progressChanged; result via mesh_loaded/geometry_load_failed. Returns True if worker started."""
-        if self._geometry_load_worker is not None and self._geometry_load_worker.isRunning():
-            return False
-        from mapfree.gui.workers import GeometryLoadWorker
-
-        self._geometry_load_worker = GeometryLoadWorker(str(file_path), is_point_cloud=False)
-        self._geometry_load_worker.progress.connect(self.progressChanged.emit)
-        self._geometry_load_worker.loadDone.connect(self._on_geometry_load_done)
-        self._geometry_load_worker.loadFailed.connect(self._on_geometry_load_failed)
-        self._geometry_load_worker.start()
-        return True
+        """Start loading a PLY mesh in background thread; progress via progressChanged; result via mesh_loaded/geometry_load_failed. Returns False only if a load is already running."""
+        return self._start_geometry_load(file_path, is_point_cloud=False)
 
     def load_point_cloud_async(self, file_path: str) -> bool:
-        """Start loading a PLY point cloud in background thread; progress via progressChanged. Returns True if worker started."""
+        """Start loading a PLY point cloud in background thread; progress via progressChanged. Returns False only if a load is already running."""
+        return self._start_geometry_load(file_path, is_point_cloud=True)
+
+    def _start_geometry_load(self, file_path: str, is_point_cloud: bool) -> bool:
+        """Read the PLY header here (cheap) and decode the body on a GeometryLoadWorker.
+
+        An unreadable header fails immediately via geometry_load_failed, without starting a thread.
+        """
         if self._geometry_load_worker is not None and self._geometry_load_worker.isRunning():
             return False
+        ply = _open_ply(str(file_path))
+        if ply is None:
+            self._on_geometry_load_failed(str(file_path))
+            return True
         from mapfree.gui.workers import GeometryLoadWorker
 
-        self._geometry_load_worker = GeometryLoadWorker(str(file_path), is_point_cloud=True)
+        self._geometry_load_worker = GeometryLoadWorker(str(file_path), is_point_cloud=is_point_cloud, ply=ply)
         self._geometry_load_worker.progress.connect(self.progressChanged.emit)
         self._geometry_load_worker.loadDone.connect(self._on_geometry_load_done)
         self._geometry_load_worker.loadFailed.connect(self._on_geometry_load_failed)
         self._geometry_load_worker.start()
         return True
 
-    def load_point_cloud(self, file_path: str) -> bool:
-        """Load a PLY point cloud (synchronous). Returns True on success. Prefer load_point_cloud_async for large files."""
+    def load_point_cloud(self, file_path: str | os.PathLike | bytes | io.BytesIO) -> bool:
+        """Load a PLY point cloud from a path or in-memory bytes (synchronous). Returns True on success.
+        Prefer load_point_cloud_async for large files."""
         data = _load_ply(file_path)
-        if data is None or not data["vertices"]:
+        if data is None or not _has_rows(data["vertices"]):
             return False
-        vertices = data["vertices"]
-        normals = data.get("normals")
-        colors = data.get("colors")
-        if not colors:
-            colors = [(0.7, 0.7, 0.7)] * len(vertices)
-        if not normals:
-            normals = [(0.0, 1.0, 0.0)] * len(vertices)
-        vertices, normals, colors, _ = _simplify_for_render(vertices, normals, colors, None)
-        if not self._use_fallback:
-            self._upload_geometry(vertices, normals, colors, indices=None)
-        self._num_indices = 0
-        self._num_vertices = len(vertices)
-        self.update()
-        self.mesh_loaded.emit(str(file_path), self._num_vertices)
+        self._show_geometry(data["vertices"], data.get("normals"), data.get("colors"), None)
+        self.mesh_loaded.emit(_ply_source_name(file_path), self._num_vertices)
         return True
 
-    def load_mesh(self, file_path: str) -> bool:
-        """Load a PLY mesh (synchronous). Returns True on success. Prefer load_mesh_async for large files."""
+    def load_mesh(self, file_path: str | os.PathLike | bytes | io.BytesIO) -> bool:
+        """Load a PLY mesh from a path or in-memory bytes (synchronous). Returns True on success.
+        Prefer load_mesh_async for large files."""
         data = _load_ply(file_path)
-        if data is None or not data["vertices"]:
+        if data is None or not _has_rows(data["vertices"]):
             return False
-        vertices = data["vertices"]
-        normals = data.get("normals")
-        colors = data.get("colors")
-        indices = data.get("indices")
-        if not colors:
-            colors = [(0.7, 0.7, 0.7)] * len(vertices)
-        if not normals:
-            normals = [(0.0, 1.0, 0.0)] * len(vertices)
+        self._show_geometry(data["vertices"], data.get("normals"), data.get("colors"), data.get("indices"))
+        self.mesh_loaded.emit(_ply_source_name(file_path), self._num_vertices)
+        return True
+
+    def load_many(self, file_paths: list[str | os.PathLike | bytes | io.BytesIO]) -> list[bool]:
+        """Load several PLYs (paths or in-memory bytes) as one scene with a single buffer upload.
+
+        Vertices of all files are concatenated and triangle indices offset to match, so the
+        scene is one VBO/EBO upload and one draw call. If any file is a point cloud, the whole
+        batch is drawn as points. Returns one success flag per input.
+        """
+        parts = []
+        ok = []
+        for src in file_paths:
+            data = _load_ply(src)
+            loaded = data is not None and _has_rows(data["vertices"])
+            ok.append(loaded)
+            if loaded:
+                parts.append((src, data))
+        if not parts:
+            return ok
+        vertices = np.concatenate([np.asarray(d["vertices"], dtype=np.float32) for _, d in parts])
+        colors = np.concatenate([
+            d["colors"] if _has_rows(d.get("colors"))
+            else np.broadcast_to(_DEFAULT_COLOR, (len(d["vertices"]), 3))
+            for _, d in parts
+        ]).astype(np.float32, copy=False)
+        normals = None
+        if all(_has_rows(d.get("normals")) for _, d in parts):
+            normals = np.concatenate([d["normals"] for _, d in parts])
+        indices = None
+        if all(_has_rows(d.get("indices")) for _, d in parts):
+            # One allocation; each part's indices are offset straight into their slice
+            indices = np.empty(sum(len(d["indices"]) for _, d in parts), dtype=np.uint32)
+            base = pos = 0
+            for _, d in parts:
+                k = len(d["indices"])
+                np.add(d["indices"], base, out=indices[pos:pos + k], casting="unsafe")
+                base += len(d["vertices"])
+                pos += k
+        self._show_geometry(vertices, normals, colors, indices)
+        for src, d in parts:
+            self.mesh_loaded.emit(_ply_source_name(src), len(d["vertices"]))
+        return ok
+
+    def _show_geometry(
+        self,
+        vertices: np.ndarray,
+        normals: np.ndarray | None,
+        colors: np.ndarray | None,
+        indices: np.ndarray | None,
+    ) -> None:
+        """Simplify, upload and frame parsed geometry as the current scene (indices None: points)."""
+        if not _has_rows(colors):
+            colors = np.broadcast_to(_DEFAULT_COLOR, (len(vertices), 3))
         vertices, normals, colors, indices = _simplify_for_render(vertices, normals, colors, indices)
+        self._set_scene_bounds(vertices)
+        if not _has_rows(indices):
+            indices = None
         if not self._use_fallback:
-            if indices:
-                self._upload_geometry(vertices, normals, colors, indices=indices)
-                self._num_indices = len(indices)
-            else:
-                self._upload_geometry(vertices, normals, colors, indices=None)
-                self._num_indices = 0
+            self._upload_geometry(vertices, normals, colors, indices=indices)
+        self._num_indices = len(indices) if indices is not None else 0
         self._num_vertices = len(vertices)
         self.update()
-        self.mesh_loaded.emit(str(file_path), self._num_vertices)
-        return True
 
     def _upload_geometry(
         self,
-        vertices: list[tuple[float, float, float]],
-        normals: list[tuple[float, float, float]],
-        colors: list[tuple[float, float, float]],
-        indices: list[int] | None,
+        vertices: np.ndarray,
+        normals: np.ndarray | None,
+        colors: np.ndarray,
+        indices: np.ndarray | None,
     ) -> None:
-        """Upload interleaved vertex data (pos, color, normal) and optional EBO. Mesh Buffer Guard: auto-decimate if over MAX_SAFE_VERTICES."""
-        import struct
+        """Upload interleaved vertex data (pos, color[, normal]) and optional EBO. Mesh Buffer Guard: auto-decimate if over MAX_SAFE_VERTICES."""
+        if not self._gl or not self._vao:
+            return
         # Mesh Buffer Guard: before uploading to GPU, cap vertex count to avoid OOM
         if len(vertices) > MAX_SAFE_VERTICES:
             vertices, normals, colors, indices = _simplify_for_render(
                 vertices, normals, colors, indices, max_vertices=MAX_SAFE_VERTICES
             )
-        buf = []
-        for i in range(len(vertices)):
-            buf.append(vertices[i][0])
-            buf.append(vertices[i][1])
-            buf.append(vertices[i][2])
-            buf.append(colors[i][0])
-            buf.append(colors[i][1])
-            buf.append(colors[i][2])
-            buf.append(normals[i][0])
-            buf.append(normals[i][1])
-            buf.append(normals[i][2])
-        data = struct.pack(f"{len(buf)}f", *buf)
+        # Normals are only uploaded for meshes that have them; point clouds never read them and
+        # meshes without them are shaded with derivative normals in the fragment shader
+        with_normals = _has_rows(normals) and _has_rows(indices)
+        interleaved = self._scratch_rows(len(vertices), 9 if with_normals else 6)
+        interleaved[:, 0:3] = vertices
+        interleaved[:, 3:6] = colors
+        if with_normals:
+            interleaved[:, 6:9] = normals
+        self._use_derivative_normals = not with_normals
         self.makeCurrent()
         self._vao.bind()
         self._vbo.bind()
-        self._vbo.allocate(data, len(data))
-        # Attribute layout: 0=pos(3), 1=color(3), 2=normal(3); stride 9 floats, 36 bytes
-        if not self._gl or not self._vao:
-            if self._vao:
-                self._vao.release()
-            self.doneCurrent()
-            return
-        g = self._gl
-        stride = 9 * 4
-        g.glEnableVertexAttribArray(0)
-        g.glVertexAttribPointer(0, 3, GL_FLOAT, GL_FALSE, stride, 0)
-        g.glEnableVertexAttribArray(1)
-        g.glVertexAttribPointer(1, 3, GL_FLOAT, GL_FALSE, stride, 3 * 4)
-        g.glEnableVertexAttribArray(2)
-        g.glVertexAttribPointer(2, 3, GL_FLOAT, GL_FALSE, stride, 6 * 4)
-        if indices and self._ebo:
+        # Attribute pointers live in the VAO; only re-recorded when the stride changes
+        if with_normals != self._vbo_has_normals:
+            self._set_vertex_layout(with_normals)
+        _write_buffer(self._vbo, interleaved)
+        if _has_rows(indices) and self._ebo:
+            # 16-bit indices whenever every vertex is addressable: half the index bandwidth
+            if len(vertices) < 65536:
+                idx = self._scratch_indices(len(indices), np.uint16)
+                self._index_gl_type = GL_UNSIGNED_SHORT
+            else:
+                idx = self._scratch_indices(len(indices), np.uint32)
+                self._index_gl_type = GL_UNSIGNED_INT
+            idx[:] = indices
             self._ebo.bind()
-            self._ebo.allocate(struct.pack(f"{len(indices)}I", *indices), len(indices) * 4)
+            _write_buffer(self._ebo, idx)
         self._vao.release()
         self.doneCurrent()
 
+    def _scratch_rows(self, n: int, width: int) -> np.ndarray:
+        """Return an (n, width) float32 view of the persistent upload scratch, growing it if needed.
+
+        Reused across uploads so reloads do not allocate a fresh interleave buffer each time.
+        """
+        size = n * width
+        if self._scratch is None or self._scratch.size < size:
+            grown = 0 if self._scratch is None else self._scratch.size + self._scratch.size // 2
+            self._scratch = np.empty(max(size, grown), dtype=np.float32)
+        return self._scratch[:size].reshape(n, width)
+
+    def _scratch_indices(self, n: int, dtype) -> np.ndarray:
+        """Return an (n,) view of the persistent index scratch as dtype, growing it like _scratch_rows."""
+        nbytes = n * np.dtype(dtype).itemsize
+        if self._index_scratch is None or self._index_scratch.size < nbytes:
+            grown = 0 if self._index_scratch is None else self._index_scratch.size + self._index_scratch.size // 2
+            self._index_scratch = np.empty(max(nbytes, grown), dtype=np.uint8)
+        return self._index_scratch[:nbytes].view(dtype)
+
+    def _set_scene_bounds(self, vertices: np.ndarray) -> None:
+        """Cache axis-aligned bounds, center and bounding radius of the loaded geometry for zoom_fit."""
+        v = np.asarray(vertices, dtype=np.float32)
+        self._bbox_min = v.min(axis=0)
+        self._bbox_max = v.max(axis=0)
+        self._center = (self._bbox_min + self._bbox_max) * 0.5
+        self._radius = float(np.linalg.norm(self._bbox_max - self._center))
+
     def zoom_fit(self) -> None:
-        """Reset camera to fit the scene (default orbit and distance)."""
-        self._camera.reset()
+        """Frame the loaded geometry (cached bounds); default orbit and distance when the scene is empty."""
+        if self._center is None:
+            self._camera.reset()
+        else:
+            c = self._center
+            self._camera.fit_sphere(QVector3D(float(c[0]), float(c[1]), float(c[2])), self._radius)
         self.update()
 
     def toggle_axes(self) -> None:
@@ -878,14 +932,13 @@ class ViewerWidget(QOpenGLWidget):
         """Clear geometry and release buffer contents."""
         self._num_vertices = 0
         self._num_indices = 0
+        self._bbox_min = self._bbox_max = self._center = None
+        self._radius = 0.0
         self.makeCurrent()
         if self._gl and self._vao and self._vbo and self._ebo:
-            g = self._gl
+            # Keep the VAO's attribute setup; the next load just refills the same buffers
             self._vao.bind()
             self._vbo.bind()
-            g.glDisableVertexAttribArray(0)
-            g.glDisableVertexAttribArray(1)
-            g.glDisableVertexAttribArray(2)
             self._vbo.allocate(0)
             self._ebo.bind()
             self._ebo.allocate(0)
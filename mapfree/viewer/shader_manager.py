@@ -2,7 +2,7 @@
 
 from typing import Any
 
-from PySide6.QtGui import QMatrix4x4, QVector3D
+from PySide6.QtGui import QMatrix4x4, QOpenGLContext, QVector3D
 from PySide6.QtOpenGL import QOpenGLShader, QOpenGLShaderProgram
 
 
@@ -20,12 +20,13 @@ out vec3 vFragPos;
 uniform mat4 uProjection;
 uniform mat4 uView;
 uniform mat4 uModel;
+uniform mat3 uNormalMatrix;  // transpose(inverse(mat3(uModel))), computed on the CPU
 void main() {
     vec4 worldPos = uModel * vec4(aPos, 1.0);
     gl_Position = uProjection * uView * worldPos;
     vFragPos = worldPos.xyz;
     vColor = aColor;
-    vNormal = mat3(transpose(inverse(uModel))) * aNormal;
+    vNormal = uNormalMatrix * aNormal;
 }
 """
 
@@ -48,6 +49,25 @@ void main() {
 }
 """
 
+# Mesh without vertex normals: face normal from screen-space derivatives of the world position
+MESH_FLAT_FRAGMENT_GLSL = """#version 330 core
+in vec3 vColor;
+in vec3 vFragPos;
+out vec4 FragColor;
+uniform vec3 uCameraPosition;
+uniform vec3 uLightDir;
+uniform vec3 uAmbientColor;
+uniform vec3 uDiffuseColor;
+void main() {
+    vec3 N = normalize(cross(dFdx(vFragPos), dFdy(vFragPos)));
+    vec3 L = normalize(-uLightDir);
+    float diff = max(dot(N, L), 0.0);
+    vec3 ambient = uAmbientColor * vColor;
+    vec3 diffuse = uDiffuseColor * diff * vColor;
+    FragColor = vec4(ambient + diffuse, 1.0);
+}
+"""
+
 # -----------------------------------------------------------------------------
 # Point cloud
 # -----------------------------------------------------------------------------
@@ -76,6 +96,18 @@ void main() {
 """
 
 
+def _init_normal_matrix(program: QOpenGLShaderProgram) -> None:
+    """Start uNormalMatrix at identity (matches the default identity uModel) so normals are never zero."""
+    program.bind()
+    program.setUniformValue("uNormalMatrix", QMatrix4x4().normalMatrix())
+    program.release()
+
+
+def _uniform_locations(program: QOpenGLShaderProgram, names: tuple[str, ...]) -> dict[str, int]:
+    """Look up uniform locations once after link (-1 for uniforms the program does not use)."""
+    return {name: program.uniformLocation(name) for name in names}
+
+
 # -----------------------------------------------------------------------------
 # ShaderManager
 # -----------------------------------------------------------------------------
@@ -86,13 +118,18 @@ class ShaderManager:
     def __init__(self) -> None:
         self._program_mesh: QOpenGLShaderProgram | None = None
         self._program_point_cloud: QOpenGLShaderProgram | None = None
+        self._program_mesh_flat: QOpenGLShaderProgram | None = None
         self._initialized = False
 
     def init(self, context: Any = None) -> bool:
         """Compile and link shaders. Requires a current OpenGL context. Return True on success."""
         if self._initialized:
             return True
-        ok = self._compile_mesh_program() and self._compile_point_cloud_program()
+        ok = (
+            self._compile_mesh_program()
+            and self._compile_mesh_flat_program()
+            and self._compile_point_cloud_program()
+        )
         self._initialized = ok
         return ok
 
@@ -104,9 +141,22 @@ class ShaderManager:
             return False
         if not prog.link():
             return False
+        _init_normal_matrix(prog)
         self._program_mesh = prog
         return True
 
+    def _compile_mesh_flat_program(self) -> bool:
+        prog = QOpenGLShaderProgram()
+        if not prog.addShaderFromSourceCode(QOpenGLShader.Vertex, MESH_VERTEX_GLSL):
+            return False
+        if not prog.addShaderFromSourceCode(QOpenGLShader.Fragment, MESH_FLAT_FRAGMENT_GLSL):
+            return False
+        if not prog.link():
+            return False
+        _init_normal_matrix(prog)
+        self._program_mesh_flat = prog
+        return True
+
     def _compile_point_cloud_program(self) -> bool:
         prog = QOpenGLShaderProgram()
         if not prog.addShaderFromSourceCode(QOpenGLShader.Vertex, POINT_VERTEX_GLSL):
@@ -122,6 +172,10 @@ class ShaderManager:
         """Return the shader program used for colored mesh rendering (directional light, camera)."""
         return self._program_mesh
 
+    def mesh_flat_program(self) -> QOpenGLShaderProgram | None:
+        """Return the mesh program for geometry without normals (derivative-based face normals)."""
+        return self._program_mesh_flat
+
     def point_cloud_program(self) -> QOpenGLShaderProgram | None:
         """Return the shader program used for point cloud rendering."""
         return self._program_point_cloud
@@ -131,6 +185,14 @@ class ShaderManager:
         if program is not None and program.isLinked():
             program.setUniformValue(name, matrix)
 
+    def set_mesh_model(self, model: QMatrix4x4, program: QOpenGLShaderProgram | None = None) -> None:
+        """Set uModel and its normal matrix on a mesh program (default: mesh_program()). Program should be bound."""
+        prog = program if program is not None else self._program_mesh
+        if prog is None or not prog.isLinked():
+            return
+        prog.setUniformValue("uModel", model)
+        prog.setUniformValue("uNormalMatrix", model.normalMatrix())
+
     def set_uniform_vec3(self, program: QOpenGLShaderProgram | None, name: str, x: float, y: float, z: float) -> None:
         """Set a vec3 uniform by name. Program should be bound."""
         if program is not None and program.isLinked():
@@ -167,4 +229,31 @@ class ShaderManager:
         if self._program_point_cloud is not None:
             self._program_point_cloud.release()
             self._program_point_cloud = None
+        if self._program_mesh_flat is not None:
+            self._program_mesh_flat.release()
+            self._program_mesh_flat = None
         self._initialized = False
+
+
+# One ShaderManager per GL share group (programs are valid in every context of the group)
+_SHARED_MANAGERS: dict[int, ShaderManager] = {}
+
+
+def shared_shader_manager() -> ShaderManager | None:
+    """Return the ShaderManager for the current context's share group, compiling on first use.
+
+    Returns None if no context is current or the shaders fail to compile/link.
+    """
+    ctx = QOpenGLContext.currentContext()
+    if ctx is None:
+        return None
+    group = ctx.shareGroup()
+    key = id(group)
+    sm = _SHARED_MANAGERS.get(key)
+    if sm is None:
+        sm = ShaderManager()
+        if not sm.init():
+            return None
+        _SHARED_MANAGERS[key] = sm
+        group.destroyed.connect(lambda *_: _SHARED_MANAGERS.pop(key, None))
+    return sm
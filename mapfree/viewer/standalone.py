@@ -16,9 +16,27 @@ os.environ.setdefault("LIBGL_ALWAYS_SOFTWARE", "1")
 
 from pathlib import Path
 
-from PySide6.QtWidgets import QApplication, QMainWindow, QFileDialog, QMessageBox
 
-from mapfree.viewer.gl_widget import ViewerWidget, set_default_opengl_format
+def _dir_entries(d: Path) -> dict[str, os.DirEntry]:
+    """List d once (name -> entry); {} if it is missing or unreadable."""
+    try:
+        with os.scandir(d) as it:
+            return {e.name: e for e in it}
+    except OSError:
+        return {}
+
+
+def _entry_size(entries: dict[str, os.DirEntry], name: str) -> int:
+    """Size of a regular file in a _dir_entries listing, -1 if absent.
+
+    DirEntry.stat() is free on Windows (comes with the listing) and one stat elsewhere, only for
+    names that are actually present.
+    """
+    e = entries.get(name)
+    try:
+        return e.stat().st_size if e is not None and e.is_file() else -1
+    except OSError:
+        return -1
 
 
 def _best_result_path(project_path: Path):
@@ -30,27 +48,31 @@ def _best_result_path(project_path: Path):
         mesh_dir, dense_dir = paths.mesh, paths.dense
     except Exception:
         mesh_dir, dense_dir = proj / "mvs", proj / "dense"
-    for mdir in (mesh_dir, proj / "openmvs", proj / "mvs"):
-        if not mdir.exists():
-            continue
+    # One directory listing per candidate directory instead of a stat per candidate file
+    for mdir in dict.fromkeys((mesh_dir, proj / "openmvs", proj / "mvs")):
+        entries = _dir_entries(mdir)
         for name in ("scene_mesh_refine.ply", "scene_mesh.ply"):
-            p = mdir / name
-            if p.exists() and p.stat().st_size > 0:
-                return str(p), True
-    fused = dense_dir / "fused.ply"
-    if fused.exists() and fused.stat().st_size >= 1024:
-        return str(fused), False
+            if _entry_size(entries, name) > 0:
+                return str(mdir / name), True
+    if _entry_size(_dir_entries(dense_dir), "fused.ply") >= 1024:
+        return str(dense_dir / "fused.ply"), False
     final = proj / "final_results"
+    final_entries = _dir_entries(final)
     for name in ("dense.ply", "sparse.ply"):
-        p = final / name
-        if p.exists():
-            if name == "dense.ply" and p.stat().st_size < 1024:
+        size = _entry_size(final_entries, name)
+        if size >= 0:
+            if name == "dense.ply" and size < 1024:
                 continue
-            return str(p), False
+            return str(final / name), False
     return None, False
 
 
 def main():
+    # Qt/GL libraries load only when the viewer actually runs, not on import of this module
+    from PySide6.QtWidgets import QApplication, QMainWindow, QFileDialog, QMessageBox
+
+    from mapfree.viewer.gl_widget import ViewerWidget, set_default_opengl_format
+
     project_path = sys.argv[1] if len(sys.argv) > 1 else None
     app = QApplication(sys.argv)
     app.setApplicationName("MapFree 3D Viewer")
@@ -1,7 +1,10 @@
 """COLMAP CLI wrapper. Builds and runs COLMAP commands with config-driven parameters."""
 
+import logging
 import os
 import subprocess
+from collections import deque
+from collections.abc import Sequence
 from pathlib import Path
 
 from .exceptions import ColmapError
@@ -9,11 +12,25 @@ from .logger import get_logger
 
 logger = get_logger("colmap")
 
+# Output lines kept for the ColmapError message; the rest is only streamed to the log.
+_ERROR_TAIL_LINES = 50
+
 # So COLMAP finds venv libs (e.g. libonnxruntime.so.1) when PATH/LD_LIBRARY_PATH not set in shell.
 _VENV_LIB = "/media/pop_mangto/E/dev/MapFree/venv/lib"
 
 
-def run_colmap(cmd: list[str], dry_run: bool = False, num_threads: int = 4) -> None:
+def _env_for(num_threads: int) -> dict[str, str]:
+    """Return the COLMAP child environment: the current os.environ plus library path and thread count.
+
+    Built per call so later changes to PATH, CUDA_VISIBLE_DEVICES etc. reach every COLMAP run.
+    """
+    env = dict(os.environ)
+    env["LD_LIBRARY_PATH"] = _VENV_LIB + ":" + env.get("LD_LIBRARY_PATH", "")
+    env["OMP_NUM_THREADS"] = str(num_threads)
+    return env
+
+
+def run_colmap(cmd: Sequence[str], dry_run: bool = False, num_threads: int = 4) -> None:
     """
     Execute a COLMAP command. Log the command; if dry_run, only log and return.
     Raises ColmapError on non-zero exit.
@@ -21,122 +38,135 @@ def run_colmap(cmd: list[str], dry_run: bool = False, num_threads: int = 4) -> N
     logger.info("COLMAP: %s", " ".join(cmd))
     if dry_run:
         return
-    env = dict(os.environ)
-    env["LD_LIBRARY_PATH"] = _VENV_LIB + ":" + env.get("LD_LIBRARY_PATH", "")
-    env["OMP_NUM_THREADS"] = str(num_threads)
-    result = subprocess.run(cmd, env=env, capture_output=True, text=True)
-    if result.returncode != 0:
-        raise ColmapError(
-            f"COLMAP failed (exit {result.returncode}): {result.stderr or result.stdout}"
-        )
-    if result.stdout:
-        logger.debug("%s", result.stdout[:500])
-
-
-def build_feature_extractor_args(project_path: Path, image_path: Path, config: dict) -> list[str]:
+    env = _env_for(num_threads)
+    # Stream output line by line (constant memory on long dense runs). Bytes are decoded only when
+    # a line is actually logged at debug, or for the error tail; at INFO stdout goes to DEVNULL.
+    debug = logger.isEnabledFor(logging.DEBUG)
+    tail: deque[bytes] = deque(maxlen=_ERROR_TAIL_LINES)
+    proc = subprocess.Popen(
+        cmd,
+        env=env,
+        stdout=subprocess.PIPE if debug else subprocess.DEVNULL,
+        stderr=subprocess.STDOUT if debug else subprocess.PIPE,
+        bufsize=1 << 20,
+    )
+    with proc:
+        for line in proc.stdout if debug else proc.stderr:
+            if debug:
+                logger.debug("%s", line.decode("utf-8", "replace").rstrip())
+            tail.append(line)
+    if proc.returncode != 0:
+        output = b"".join(tail).decode("utf-8", "replace").rstrip()
+        raise ColmapError(f"COLMAP failed (exit {proc.returncode}): {output}")
+
+
+# Constant argv heads, shared by every call of the matching builder.
+_FE_PREFIX = (
+    "colmap", "feature_extractor",
+    "--ImageReader.single_camera", "0",
+    "--ImageReader.camera_model", "OPENCV",
+)
+_MAPPER_PREFIX = ("colmap", "mapper")
+_UNDISTORT_PREFIX = ("colmap", "image_undistorter", "--output_type", "COLMAP")
+_PMS_PREFIX = ("colmap", "patch_match_stereo", "--workspace_format", "COLMAP")
+_FUSION_PREFIX = (
+    "colmap", "stereo_fusion",
+    "--workspace_format", "COLMAP",
+    "--input_type", "geometric",
+)
+
+
+def build_feature_extractor_args(project_path: Path, image_path: Path, config: dict) -> tuple[str, ...]:
     """Build COLMAP feature_extractor command args (without 'colmap feature_extractor')."""
-    project_path = Path(project_path)
-    image_path = Path(image_path)
-    db = project_path / "database.db"
+    if not isinstance(project_path, Path):
+        project_path = Path(project_path)
     fe_cfg = config.get("feature_extractor", {})
     max_size = fe_cfg.get("max_image_size", 2000)
     gpu = fe_cfg.get("gpu_index", 0)
     num_threads = config.get("system", {}).get("num_threads", -1)
-    args = [
-        "colmap", "feature_extractor",
-        "--database_path", str(db),
-        "--image_path", str(image_path),
-        "--ImageReader.single_camera", "0",
-        "--ImageReader.camera_model", "OPENCV",
+    return (
+        *_FE_PREFIX,
+        "--database_path", os.fspath(project_path / "database.db"),
+        "--image_path", os.fspath(image_path),
         "--FeatureExtraction.max_image_size", str(max_size),
         "--FeatureExtraction.num_threads", str(num_threads),
         "--FeatureExtraction.gpu_index", str(gpu),
-    ]
-    return args
+    )
 
 
-def build_matcher_args(project_path: Path, config: dict) -> list[str]:
+def build_matcher_args(project_path: Path, config: dict) -> tuple[str, ...]:
     """Build COLMAP matcher command args. Uses spatial or sequential from config."""
-    project_path = Path(project_path)
-    db = project_path / "database.db"
+    if not isinstance(project_path, Path):
+        project_path = Path(project_path)
     matcher_cfg = config.get("matcher", {})
     match_type = matcher_cfg.get("type", "spatial")
     gpu = matcher_cfg.get("gpu_index", 0)
     cmd = "sequential_matcher" if match_type == "sequential" else "spatial_matcher"
-    args = ["colmap", cmd, "--database_path", str(db), "--FeatureMatching.gpu_index", str(gpu)]
-    return args
+    return (
+        "colmap", cmd,
+        "--database_path", os.fspath(project_path / "database.db"),
+        "--FeatureMatching.gpu_index", str(gpu),
+    )
 
 
-def build_mapper_args(project_path: Path, config: dict) -> list[str]:
+def build_mapper_args(project_path: Path, config: dict) -> tuple[str, ...]:
     """Build COLMAP mapper command args."""
-    project_path = Path(project_path)
-    db = project_path / "database.db"
-    sparse = project_path / "sparse"
+    if not isinstance(project_path, Path):
+        project_path = Path(project_path)
     mapper_cfg = config.get("mapper", {})
     ba_iter = mapper_cfg.get("ba_global_max_iterations", 50)
     ba_refine = mapper_cfg.get("ba_global_max_refinements", 5)
-    args = [
-        "colmap", "mapper",
-        "--database_path", str(db),
-        "--image_path", str(project_path / "images"),  # mapper expects images in project
-        "--output_path", str(sparse),
+    return (
+        *_MAPPER_PREFIX,
+        "--database_path", os.fspath(project_path / "database.db"),
+        "--image_path", os.fspath(project_path / "images"),  # mapper expects images in project
+        "--output_path", os.fspath(project_path / "sparse"),
         "--Mapper.ba_global_max_num_iterations", str(ba_iter),
         "--Mapper.ba_global_max_refinements", str(ba_refine),
-    ]
-    return args
+    )
 
 
-def build_image_undistorter_args(project_path: Path) -> list[str]:
+def build_image_undistorter_args(project_path: Path) -> tuple[str, ...]:
     """Build COLMAP image_undistorter command args."""
-    project_path = Path(project_path)
-    sparse0 = project_path / "sparse" / "0"
-    image_path = project_path / "images"
-    dense = project_path / "dense"
-    args = [
-        "colmap", "image_undistorter",
-        "--image_path", str(image_path),
-        "--input_path", str(sparse0),
-        "--output_path", str(dense),
-        "--output_type", "COLMAP",
-    ]
-    return args
-
-
-def build_patch_match_stereo_args(project_path: Path, config: dict) -> list[str]:
+    if not isinstance(project_path, Path):
+        project_path = Path(project_path)
+    return (
+        *_UNDISTORT_PREFIX,
+        "--image_path", os.fspath(project_path / "images"),
+        "--input_path", os.fspath(project_path / "sparse" / "0"),
+        "--output_path", os.fspath(project_path / "dense"),
+    )
+
+
+def build_patch_match_stereo_args(project_path: Path, config: dict) -> tuple[str, ...]:
     """Build COLMAP patch_match_stereo command args (WebODM-style for 2GB VRAM)."""
-    project_path = Path(project_path)
-    dense = project_path / "dense"
+    if not isinstance(project_path, Path):
+        project_path = Path(project_path)
     pm_cfg = config.get("patch_match_stereo", {})
     max_size = pm_cfg.get("max_image_size", 800)
     gpu = pm_cfg.get("gpu_index", 0)
     cache_size = pm_cfg.get("cache_size", 8)
     window_step = pm_cfg.get("window_step", 2)
     geom_consistency = pm_cfg.get("geom_consistency", 0)
-    args = [
-        "colmap", "patch_match_stereo",
-        "--workspace_path", str(dense),
-        "--workspace_format", "COLMAP",
+    return (
+        *_PMS_PREFIX,
+        "--workspace_path", os.fspath(project_path / "dense"),
         "--PatchMatchStereo.gpu_index", str(gpu),
         "--PatchMatchStereo.max_image_size", str(max_size),
         "--PatchMatchStereo.cache_size", str(cache_size),
         "--PatchMatchStereo.window_step", str(window_step),
         "--PatchMatchStereo.geom_consistency", str(geom_consistency),
-    ]
-    return args
+    )
 
 
-def build_stereo_fusion_args(project_path: Path, config: dict | None = None) -> list[str]:
+def build_stereo_fusion_args(project_path: Path, config: dict | None = None) -> tuple[str, ...]:
     """Build COLMAP stereo_fusion command args (max_image_size for MX150 VRAM)."""
-    project_path = Path(project_path)
-    dense = project_path / "dense"
+    dense = Path(project_path) / "dense"
     fusion_cfg = (config or {}).get("stereo_fusion", {})
     max_size = fusion_cfg.get("max_image_size", 800)
-    args = [
-        "colmap", "stereo_fusion",
-        "--workspace_path", str(dense),
-        "--workspace_format", "COLMAP",
-        "--input_type", "geometric",
-        "--output_path", str(dense / "fused.ply"),
+    return (
+        *_FUSION_PREFIX,
+        "--workspace_path", os.fspath(dense),
+        "--output_path", os.fspath(dense / "fused.ply"),
         "--StereoFusion.max_image_size", str(max_size),
-    ]
-    return args
+    )
@@ -1,7 +1,11 @@
 """Output helpers: paths and optional copy for sparse/dense results."""
 
+import os
+import shutil
 from pathlib import Path
 
+from .utils import copy_file_range
+
 
 def get_sparse_model_path(project_path: Path) -> Path:
     """Path to sparse reconstruction (sparse/0 with cameras, images, points3D)."""
@@ -15,14 +19,24 @@ def get_dense_ply_path(project_path: Path) -> Path:
 
 def ensure_dense_ply_copy(project_path: Path, name: str = "dense_pointcloud.ply") -> Path:
     """
-    Copy fused.ply to project_path/dense/<name> for a predictable filename.
+    Link or copy fused.ply to project_path/dense/<name> for a predictable filename.
+    Prefers a hardlink, then an in-kernel (reflink) copy, then a full copy.
     Return path to the copy. No-op if source missing.
     """
     src = get_dense_ply_path(project_path)
     dst = Path(project_path) / "dense" / name
+    # Plain stat: fused.ply is written by COLMAP, which never invalidates the stat cache
     if not src.exists():
         return src
-    if dst.resolve() != src.resolve():
-        import shutil
-        shutil.copy2(src, dst)
+    if dst.exists():  # fresh stat: a stale answer here could write through a hardlink to src
+        if os.path.samefile(src, dst):
+            return dst
+        dst.unlink()  # stale copy from an earlier fusion; never write through an old hardlink
+    try:
+        os.link(src, dst)
+    except OSError:
+        try:
+            copy_file_range(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
     return dst
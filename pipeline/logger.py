@@ -1,9 +1,14 @@
 """Logging setup for MapFree pipeline."""
 
 import logging
+import logging.handlers
 import sys
 from pathlib import Path
 
+# COLMAP runs stream every output line to the debug log; cap the file instead of letting it grow.
+_ROTATE_MAX_BYTES = 64 * 1024 * 1024
+_ROTATE_BACKUP_COUNT = 3
+
 
 def setup_logging(
     level: int = logging.INFO,
@@ -13,6 +18,10 @@ def setup_logging(
     root = logging.getLogger("mapfree")
     root.setLevel(level)
     root.handlers.clear()
+    # The format uses none of these fields; skip gathering them in every LogRecord.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
 
     fmt = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
 
@@ -24,7 +33,12 @@ def setup_logging(
     if log_file:
         log_file = Path(log_file)
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        fh = logging.FileHandler(log_file, encoding="utf-8")
+        fh = logging.handlers.RotatingFileHandler(
+            log_file,
+            maxBytes=_ROTATE_MAX_BYTES,
+            backupCount=_ROTATE_BACKUP_COUNT,
+            encoding="utf-8",
+        )
         fh.setLevel(level)
         fh.setFormatter(fmt)
         root.addHandler(fh)
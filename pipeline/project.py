@@ -1,15 +1,21 @@
 """Project workspace handling: create folders, validate inputs."""
 
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .exceptions import ProjectError, ValidationError
-from .utils import find_images
+from .utils import copy_file_range, find_images
+
+# Concurrent link/copy calls: each is a metadata syscall that releases the GIL (high latency on NFS)
+_LINK_WORKERS = 16
 
 
 def create_project(root: Path, project_name: str) -> Path:
     """Create project directory under root. Return project path."""
-    root = Path(root)
+    if not isinstance(root, Path):
+        root = Path(root)
     project_dir = root / project_name
     project_dir.mkdir(parents=True, exist_ok=True)
     return project_dir
@@ -17,7 +23,8 @@ def create_project(root: Path, project_name: str) -> Path:
 
 def setup_project_dirs(project_path: Path) -> dict[str, Path]:
     """Create standard subdirs: images, sparse, dense, logs. Return paths dict."""
-    project_path = Path(project_path)
+    if not isinstance(project_path, Path):
+        project_path = Path(project_path)
     dirs = {
         "project": project_path,
         "images": project_path / "images",
@@ -35,7 +42,8 @@ def validate_image_input(image_path: Path, min_images: int = 3) -> list[Path]:
     Validate that image_path is a directory with enough images.
     Returns list of image paths. Raises ValidationError if invalid.
     """
-    image_path = Path(image_path)
+    if not isinstance(image_path, Path):
+        image_path = Path(image_path)
     if not image_path.exists():
         raise ValidationError(f"Input path does not exist: {image_path}")
     if not image_path.is_dir():
@@ -49,15 +57,37 @@ def validate_image_input(image_path: Path, min_images: int = 3) -> list[Path]:
     return images
 
 
+def _link_image(src: Path, dst: Path) -> None:
+    """Place src at dst as cheaply as possible: hardlink, symlink, kernel copy, then full copy."""
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+    try:
+        dst.symlink_to(src.resolve())
+        return
+    except OSError:
+        pass
+    try:
+        copy_file_range(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
 def link_images_to_project(image_paths: list[Path], project_images_dir: Path) -> None:
-    """Symlink (or copy if symlink fails) image_paths into project/images."""
-    project_images_dir = Path(project_images_dir)
+    """Hardlink (else symlink, else copy) image_paths into project/images."""
+    if not isinstance(project_images_dir, Path):
+        project_images_dir = Path(project_images_dir)
     project_images_dir.mkdir(parents=True, exist_ok=True)
+    # One directory listing instead of an exists() stat per image
+    with os.scandir(project_images_dir) as it:
+        existing = {e.name for e in it}
+    # First source wins per name, as with the old sequential exists() check
+    todo: dict[str, Path] = {}
     for src in image_paths:
-        dst = project_images_dir / src.name
-        if dst.exists():
-            continue
-        try:
-            dst.symlink_to(src.resolve())
-        except OSError:
-            shutil.copy2(src, dst)
+        if src.name not in existing:
+            todo.setdefault(src.name, src)
+    with ThreadPoolExecutor(max_workers=_LINK_WORKERS) as ex:
+        # list() drains the results so the first link/copy error is raised here
+        list(ex.map(lambda src: _link_image(src, project_images_dir / src.name), todo.values()))
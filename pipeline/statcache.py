@@ -0,0 +1,51 @@
+"""Process-local stat() cache for the pipeline's resume checks (.done_<step> sentinels)."""
+
+import os
+import time
+from pathlib import Path
+
+# Entries older than this are re-stat'ed, so files written by other processes show up.
+DEFAULT_TTL = 2.0
+
+
+class ProjectStatCache:
+    """Memoize os.stat() per path for a short TTL; invalidate() after writing a path."""
+
+    def __init__(self, ttl: float = DEFAULT_TTL):
+        self.ttl = ttl
+        self._entries: dict[Path, tuple[float, os.stat_result | None]] = {}
+
+    def stat(self, path: Path) -> os.stat_result | None:
+        """Return the (possibly cached) stat result for path, or None if it does not exist."""
+        if not isinstance(path, Path):
+            path = Path(path)
+        now = time.monotonic()
+        hit = self._entries.get(path)
+        if hit is not None and now - hit[0] < self.ttl:
+            return hit[1]
+        try:
+            st = os.stat(path)
+        except OSError:
+            st = None
+        self._entries[path] = (now, st)
+        return st
+
+    def exists(self, path: Path) -> bool:
+        return self.stat(path) is not None
+
+    def size(self, path: Path) -> int:
+        """Size in bytes; 0 when missing."""
+        st = self.stat(path)
+        return st.st_size if st is not None else 0
+
+    def invalidate(self, path: Path) -> None:
+        """Forget path (call after creating, rewriting or removing it)."""
+        self._entries.pop(path if isinstance(path, Path) else Path(path), None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+# Shared instance used by steps.step_completed. Only for paths this process writes and
+# invalidates (mark_done); files written by COLMAP must be stat'ed directly.
+stat_cache = ProjectStatCache()
@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+from .statcache import stat_cache
+
 # Locked order; do not change without updating architecture.
 PIPELINE_STEPS = [
     "init",
@@ -21,12 +23,16 @@ def done_file(project_path: Path, step: str) -> Path:
     return Path(project_path) / DONE_FILE.format(step=step)
 
 
+def mark_done(project_path: Path, step: str) -> None:
+    """Write the .done_<step> sentinel and drop its stale entry from the stat cache."""
+    path = done_file(project_path, step)
+    path.touch()
+    stat_cache.invalidate(path)
+
+
 def step_completed(step: str, project_path: Path, dirs: dict) -> bool:
     """
     Return True if this step has already produced expected outputs (for resume).
-    Uses .done_<step> sentinel files written after each step.
+    Uses .done_<step> sentinel files written after each step (looked up through stat_cache).
     """
-    if step == "init":
-        return done_file(project_path, "init").exists()
-
-    return done_file(project_path, step).exists()
+    return stat_cache.exists(done_file(project_path, step))
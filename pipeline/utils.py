@@ -1,16 +1,43 @@
 """Small helpers for the pipeline."""
 
+import os
+import shutil
 from pathlib import Path
 
-# Extensions we consider as images (drone JPG + common RAW)
-IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".JPG", ".JPEG", ".png", ".PNG", ".tif", ".tiff", ".TIF", ".TIFF"}
-# Add common RAW if needed; COLMAP supports many
-RAW_EXTENSIONS = {".cr2", ".CR2", ".nef", ".NEF", ".arw", ".ARW", ".dng", ".DNG"}
-IMAGE_EXTENSIONS |= RAW_EXTENSIONS
+# Extensions we consider as images (drone JPG + common RAW), lowercase; compare suffix.lower()
+RAW_EXTENSIONS = frozenset({".cr2", ".nef", ".arw", ".dng"})
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".tif", ".tiff"}) | RAW_EXTENSIONS
 
 
 def find_images(directory: Path) -> list[Path]:
     """Return sorted list of image paths in directory (by name)."""
-    if not directory.is_dir():
+    # scandir entries carry the file type from the listing itself: no stat per regular file
+    try:
+        with os.scandir(directory) as it:
+            names = [
+                e.name for e in it
+                if os.path.splitext(e.name)[1].lower() in IMAGE_EXTENSIONS and e.is_file()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
         return []
-    return sorted(p for p in directory.iterdir() if p.is_file() and p.suffix in IMAGE_EXTENSIONS)
+    # Plain str keys: no Path comparisons, and the list is sorted in place
+    names.sort()
+    directory = Path(directory)
+    return [directory / name for name in names]
+
+
+def copy_file_range(src: Path, dst: Path) -> None:
+    """Copy src to dst in the kernel (reflink/COW on btrfs/xfs), keeping metadata like copy2.
+
+    Raises OSError if the platform or filesystem does not support it; callers fall back to copy2.
+    """
+    if not hasattr(os, "copy_file_range"):
+        raise OSError("os.copy_file_range is not available on this platform")
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        while remaining > 0:
+            n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+            if n == 0:
+                break
+            remaining -= n
+    shutil.copystat(src, dst)
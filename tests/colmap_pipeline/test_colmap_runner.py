@@ -0,0 +1,72 @@
+"""Tests for pipeline.colmap_runner.run_colmap, with sh -c children standing in for COLMAP."""
+import logging
+import shutil
+
+import pytest
+
+from pipeline import colmap_runner
+from pipeline.colmap_runner import run_colmap
+from pipeline.exceptions import ColmapError
+
+pytestmark = pytest.mark.skipif(shutil.which("sh") is None, reason="needs a POSIX sh")
+
+_OUT_AND_ERR = "echo to-stdout; echo to-stderr >&2; exit 3"
+
+
+@pytest.fixture
+def colmap_log_level():
+    """Set the mapfree.colmap logger level for one test."""
+    logger = logging.getLogger("mapfree.colmap")
+    old = logger.level
+
+    def _set(level):
+        logger.setLevel(level)
+    yield _set
+    logger.setLevel(old)
+
+
+def test_success(colmap_log_level):
+    colmap_log_level(logging.INFO)
+    run_colmap(["sh", "-c", "echo fine"])
+
+
+def test_dry_run_does_not_execute():
+    run_colmap(["sh", "-c", "exit 1"], dry_run=True)
+
+
+def test_nonzero_exit_at_info_reports_stderr_only(colmap_log_level):
+    colmap_log_level(logging.INFO)
+    with pytest.raises(ColmapError) as exc_info:
+        run_colmap(["sh", "-c", _OUT_AND_ERR])
+    msg = str(exc_info.value)
+    assert "exit 3" in msg
+    assert "to-stderr" in msg
+    assert "to-stdout" not in msg  # stdout goes to DEVNULL at INFO
+
+
+def test_nonzero_exit_at_debug_reports_merged_output(colmap_log_level, caplog):
+    colmap_log_level(logging.DEBUG)
+    with caplog.at_level(logging.DEBUG, logger="mapfree.colmap"):
+        with pytest.raises(ColmapError) as exc_info:
+            run_colmap(["sh", "-c", _OUT_AND_ERR])
+    msg = str(exc_info.value)
+    assert "to-stdout" in msg and "to-stderr" in msg
+    assert "to-stdout" in caplog.messages
+
+
+def test_error_keeps_only_the_output_tail(colmap_log_level):
+    colmap_log_level(logging.INFO)
+    n = colmap_runner._ERROR_TAIL_LINES + 10
+    script = f"i=0; while [ $i -lt {n} ]; do echo line$i >&2; i=$((i+1)); done; exit 1"
+    with pytest.raises(ColmapError) as exc_info:
+        run_colmap(["sh", "-c", script])
+    lines = str(exc_info.value).split(": ", 1)[1].splitlines()
+    assert len(lines) == colmap_runner._ERROR_TAIL_LINES
+    assert lines[-1] == f"line{n - 1}"
+    assert "line0" not in lines
+
+
+def test_thread_count_reaches_child(monkeypatch):
+    run_colmap(["sh", "-c", 'test "$OMP_NUM_THREADS" = 7'], num_threads=7)
+    monkeypatch.setenv("MAPFREE_TEST_MARKER", "seen")
+    run_colmap(["sh", "-c", 'test "$MAPFREE_TEST_MARKER" = seen'])
@@ -0,0 +1,31 @@
+"""Tests for pipeline.exporter (dense PLY copy under a predictable name)."""
+import os
+
+from pipeline.exporter import ensure_dense_ply_copy, get_dense_ply_path
+
+
+def test_missing_fused_ply_returns_source(tmp_path):
+    assert ensure_dense_ply_copy(tmp_path) == get_dense_ply_path(tmp_path)
+    assert not (tmp_path / "dense" / "dense_pointcloud.ply").exists()
+
+
+def test_fused_ply_written_after_a_miss_is_picked_up(tmp_path):
+    # COLMAP writes fused.ply from another process right after an earlier (missing) check
+    ensure_dense_ply_copy(tmp_path)
+    src = get_dense_ply_path(tmp_path)
+    src.parent.mkdir(parents=True)
+    src.write_bytes(b"ply\n")
+    dst = ensure_dense_ply_copy(tmp_path)
+    assert dst == tmp_path / "dense" / "dense_pointcloud.ply"
+    assert dst.read_bytes() == b"ply\n"
+
+
+def test_stale_copy_is_replaced(tmp_path):
+    src = get_dense_ply_path(tmp_path)
+    src.parent.mkdir(parents=True)
+    src.write_bytes(b"new")
+    stale = tmp_path / "dense" / "dense_pointcloud.ply"
+    stale.write_bytes(b"old")
+    dst = ensure_dense_ply_copy(tmp_path)
+    assert dst.read_bytes() == b"new"
+    assert os.path.samefile(ensure_dense_ply_copy(tmp_path), dst)
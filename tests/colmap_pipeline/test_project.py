@@ -0,0 +1,80 @@
+"""Tests for pipeline.project.link_images_to_project (link/copy fallback chain)."""
+import os
+
+import pytest
+
+from pipeline import project
+from pipeline.project import link_images_to_project
+
+
+def _fail(*args, **kwargs):
+    raise OSError("not supported")
+
+
+@pytest.fixture
+def sources(tmp_path):
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    paths = []
+    for i in range(3):
+        p = src_dir / f"IMG_{i}.jpg"
+        p.write_bytes(b"img%d" % i)
+        paths.append(p)
+    return paths
+
+
+def test_hardlink_first(tmp_path, sources):
+    dst = tmp_path / "images"
+    link_images_to_project(sources, dst)
+    for src in sources:
+        assert os.path.samefile(src, dst / src.name)
+        assert not (dst / src.name).is_symlink()
+
+
+def test_symlink_when_hardlink_fails(tmp_path, sources, monkeypatch):
+    monkeypatch.setattr(project.os, "link", _fail)
+    dst = tmp_path / "images"
+    link_images_to_project(sources, dst)
+    for src in sources:
+        assert (dst / src.name).is_symlink()
+        assert (dst / src.name).resolve() == src.resolve()
+
+
+def test_kernel_copy_when_links_fail(tmp_path, sources, monkeypatch):
+    monkeypatch.setattr(project.os, "link", _fail)
+    monkeypatch.setattr(project.Path, "symlink_to", _fail)
+    used = []
+
+    def fake_copy_file_range(src, dst):
+        used.append(src.name)
+        dst.write_bytes(src.read_bytes())
+    monkeypatch.setattr(project, "copy_file_range", fake_copy_file_range)
+    dst = tmp_path / "images"
+    link_images_to_project(sources, dst)
+    assert sorted(used) == [s.name for s in sources]
+    assert (dst / "IMG_1.jpg").read_bytes() == b"img1"
+
+
+def test_full_copy_last(tmp_path, sources, monkeypatch):
+    monkeypatch.setattr(project.os, "link", _fail)
+    monkeypatch.setattr(project.Path, "symlink_to", _fail)
+    monkeypatch.setattr(project, "copy_file_range", _fail)
+    dst = tmp_path / "images"
+    link_images_to_project(sources, dst)
+    for src in sources:
+        out = dst / src.name
+        assert not out.is_symlink() and not os.path.samefile(src, out)
+        assert out.read_bytes() == src.read_bytes()
+
+
+def test_existing_names_are_skipped_and_first_source_wins(tmp_path, sources):
+    dst = tmp_path / "images"
+    dst.mkdir()
+    (dst / "IMG_0.jpg").write_bytes(b"already here")
+    other = tmp_path / "other"
+    other.mkdir()
+    dup = other / "IMG_1.jpg"
+    dup.write_bytes(b"duplicate name")
+    link_images_to_project(sources + [dup], dst)
+    assert (dst / "IMG_0.jpg").read_bytes() == b"already here"
+    assert os.path.samefile(dst / "IMG_1.jpg", sources[1])
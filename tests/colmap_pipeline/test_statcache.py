@@ -0,0 +1,50 @@
+"""Tests for pipeline.statcache.ProjectStatCache (TTL expiry and invalidation)."""
+import pytest
+
+from pipeline import statcache
+from pipeline.statcache import ProjectStatCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.monotonic for the statcache module."""
+    now = [1000.0]
+    monkeypatch.setattr(statcache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_missing_path(tmp_path):
+    cache = ProjectStatCache()
+    assert cache.stat(tmp_path / "nope") is None
+    assert not cache.exists(tmp_path / "nope")
+    assert cache.size(tmp_path / "nope") == 0
+
+
+def test_hit_within_ttl_then_expiry(tmp_path, clock):
+    cache = ProjectStatCache(ttl=2.0)
+    path = tmp_path / "f"
+    assert not cache.exists(path)
+    path.write_bytes(b"abc")
+    clock[0] += 1.0
+    assert not cache.exists(path)  # cached miss still fresh
+    clock[0] += 1.5
+    assert cache.exists(path)  # TTL passed: re-stat'ed
+    assert cache.size(path) == 3
+
+
+def test_invalidate_forgets_entry(tmp_path, clock):
+    cache = ProjectStatCache(ttl=60.0)
+    path = tmp_path / "f"
+    assert not cache.exists(path)
+    path.touch()
+    cache.invalidate(str(path))  # str and Path keys are the same entry
+    assert cache.exists(path)
+
+
+def test_clear(tmp_path, clock):
+    cache = ProjectStatCache(ttl=60.0)
+    path = tmp_path / "f"
+    assert not cache.exists(path)
+    path.touch()
+    cache.clear()
+    assert cache.exists(path)
@@ -1,28 +1,99 @@
 """
 Pytest configuration and shared fixtures for non-GUI tests.
 
-GUI tests (viewer, Qt, OpenGL) live in tests/gui/ and are skipped automatically
-when run headless (no DISPLAY on Linux). To run them in CI or headless env:
+GUI tests (viewer, Qt, OpenGL) live in tests/gui/. When run headless (no DISPLAY on
+Linux) only the ones using the headless viewer_widget fixture run; for the rest:
 
   xvfb-run pytest tests/gui
 """
 import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 
+import pytest
+
 # Optional: set for any test that might use Qt; tests/gui/conftest also sets it for its scope
 if sys.platform.startswith("linux"):
     os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
-# Exclude script-style test files that run code at module level and call sys.exit().
-# Also exclude GUI tests that require OpenGL/Qt display.
+# Resume-state writes only need to be atomic in tests, not durable
+os.environ.setdefault("MAPFREE_STATE_SYNC", "0")
+
+# Exclude script-style files that run code at module level and call sys.exit().
 _HERE = Path(__file__).parent
 collect_ignore = [
-    str(_HERE / "test_engine_wrapper.py"),
-    str(_HERE / "test_fresh_run.py"),
-    str(_HERE / "test_resume_engine.py"),
-    str(_HERE / "test_progress_tracking.py"),
     str(_HERE / "data" / "make_20_photos.py"),
-    str(_HERE / "gui" / "test_viewer_load_mesh.py"),
-    str(_HERE / "gui" / "test_viewer_load_ply.py"),
 ]
+
+
+# Minimal JPEG-looking payload (SOI marker + padding) for stub images
+_JPEG_STUB = b"\xff\xd8" + b"\x00" * 100
+
+_SHM = "/dev/shm"
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _config():
+    """Load the default config once for the whole session instead of once per test module."""
+    from mapfree.core.config import load_config, reset_config
+    reset_config()
+    load_config()
+    yield
+
+
+@pytest.fixture(scope="session")
+def tmpfs_root():
+    """Directory for throwaway workspaces kept in RAM (tmpfs), or None to use the default temp dir.
+
+    Pass as ``tempfile.TemporaryDirectory(dir=tmpfs_root)``. Not applied globally: project
+    path validation rejects anything under /dev.
+    """
+    if os.path.isdir(_SHM) and os.access(_SHM, os.W_OK):
+        return _SHM
+    return None
+
+
+@pytest.fixture(scope="session")
+def jpeg_stub():
+    """Bytes for a stub .jpg; tests use this instead of their own payload constant."""
+    return _JPEG_STUB
+
+
+@pytest.fixture
+def create_images(jpeg_stub):
+    """Factory: create_images(folder, count) writes count stub JPEGs and returns their sorted names."""
+    def _create(folder, count):
+        folder.mkdir(parents=True, exist_ok=True)
+        names = []
+        for i in range(count):
+            name = f"IMG_{i:04d}.jpg"
+            (folder / name).write_bytes(jpeg_stub)
+            names.append(name)
+        return sorted(names)
+    return _create
+
+
+@pytest.fixture(scope="session")
+def image_template(tmpfs_root):
+    """Five stub JPEGs written once per session; tests hardlink them instead of rewriting them."""
+    root = Path(tempfile.mkdtemp(prefix="mapfree_imgs_", dir=tmpfs_root))
+    for i in range(5):
+        (root / f"IMG_{i:04d}.jpg").write_bytes(_JPEG_STUB)
+    yield root
+    shutil.rmtree(root, ignore_errors=True)
+
+
+@pytest.fixture
+def image_workspace(tmpfs_root, image_template):
+    """Fresh temp dir containing images/ populated from image_template (hardlinks, copy fallback)."""
+    with tempfile.TemporaryDirectory(dir=tmpfs_root) as tmp:
+        dst = Path(tmp) / "images"
+        dst.mkdir()
+        for f in image_template.iterdir():
+            try:
+                os.link(f, dst / f.name)
+            except OSError:
+                shutil.copy2(f, dst / f.name)
+        yield Path(tmp)
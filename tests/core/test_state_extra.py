@@ -1,4 +1,7 @@
 """Additional tests for mapfree.core.state - coverage for untested paths."""
+import json
+
+import pytest
 
 from mapfree.core.state import (
     PipelineState,
@@ -12,6 +15,7 @@ from mapfree.core.state import (
     mark_chunk_step_done,
     reset_state,
     STATE_FILE,
+    LEGACY_STATE_FILE,
     DEFAULT_STATE,
 )
 
@@ -49,6 +53,37 @@ class TestLoadSaveState:
         for key in DEFAULT_STATE:
             assert key in state
 
+    def test_reads_legacy_json_file(self, tmp_path):
+        legacy = dict(DEFAULT_STATE)
+        legacy["feature_extraction"] = True
+        (tmp_path / LEGACY_STATE_FILE).write_text(json.dumps(legacy))
+        assert load_state(tmp_path)["feature_extraction"] is True
+
+    def test_save_leaves_no_temp_files(self, tmp_path):
+        save_state(tmp_path, dict(DEFAULT_STATE))
+        save_state(tmp_path, dict(DEFAULT_STATE))
+        assert [p.name for p in tmp_path.iterdir()] == [STATE_FILE]
+
+    def test_json_state_is_plain_json(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("mapfree.core.state.msgpack", None)
+        monkeypatch.setattr("mapfree.core.state.STATE_FILE", LEGACY_STATE_FILE)
+        data = dict(DEFAULT_STATE)
+        data["feature_extraction"] = True
+        save_state(tmp_path, data)
+        assert json.loads((tmp_path / LEGACY_STATE_FILE).read_text()) == data
+        assert load_state(tmp_path)["feature_extraction"] is True
+
+    def test_msgpack_roundtrip_replaces_legacy_json(self, tmp_path):
+        msgpack = pytest.importorskip("msgpack")
+        (tmp_path / LEGACY_STATE_FILE).write_text(json.dumps(dict(DEFAULT_STATE)))
+        data = dict(DEFAULT_STATE)
+        data["chunks"] = {"chunk_01": {"mapping": True}}
+        save_state(tmp_path, data)
+        raw = (tmp_path / STATE_FILE).read_bytes()[:-8]  # minus the CRC trailer
+        assert msgpack.unpackb(raw, raw=False) == data
+        assert not (tmp_path / LEGACY_STATE_FILE).exists()
+        assert load_state(tmp_path)["chunks"]["chunk_01"]["mapping"] is True
+
 
 class TestMarkAndCheck:
     def test_mark_step_done(self, tmp_path):
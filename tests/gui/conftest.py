@@ -1,11 +1,13 @@
 """
 Pytest configuration for tests/gui.
 
-- On Linux without DISPLAY (headless CI): all tests in this directory are skipped automatically.
-- Run GUI tests with:  xvfb-run pytest tests/gui
+- On Linux without DISPLAY (headless CI): tests using the headless viewer_widget fixture run
+  (offscreen Qt platform, no GL context); every other test in this directory is skipped.
+- Run all GUI tests with:  xvfb-run pytest tests/gui
+- Without PySide6 installed, the viewer fixtures skip their tests.
 
 Qt/OpenGL: QT_QPA_PLATFORM=offscreen is set so that QOpenGLWidget can get a context
-when DISPLAY is available (e.g. under xvfb). Without DISPLAY, tests are skipped before any Qt import.
+when DISPLAY is available (e.g. under xvfb).
 """
 import os
 import sys
@@ -17,6 +19,58 @@ if sys.platform.startswith("linux"):
     os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
 
 
+@pytest.fixture(scope="session")
+def qapp():
+    """Single QApplication for the GUI session; OpenGL format set before the first widget."""
+    pytest.importorskip("PySide6", reason="PySide6 not installed — skipping GUI tests")
+    from PySide6.QtWidgets import QApplication
+    from mapfree.viewer.gl_widget import set_default_opengl_format
+
+    set_default_opengl_format()
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    yield app
+
+
+@pytest.fixture(scope="session")
+def _shared_viewer_widget(qapp):
+    """One headless ViewerWidget per session: loads parse and count geometry, no GL context is realized."""
+    from mapfree.viewer.gl_widget import ViewerWidget
+
+    widget = ViewerWidget(headless=True)
+    yield widget
+    widget.close()
+
+
+@pytest.fixture
+def viewer_widget(_shared_viewer_widget):
+    """The shared headless ViewerWidget, with its scene cleared after each test."""
+    yield _shared_viewer_widget
+    _shared_viewer_widget.clear_scene()
+
+
+@pytest.fixture
+def gl_viewer_widget(qapp):
+    """ViewerWidget with a real GL context (show + processEvents); for @pytest.mark.gpu tests."""
+    from mapfree.viewer.gl_widget import ViewerWidget
+
+    widget = ViewerWidget()
+    widget.show()
+    qapp.processEvents()
+    yield widget
+    widget.close()
+
+
+# Fixtures that work without a display; gl_viewer_widget (real GL context) is not one of them
+_HEADLESS_FIXTURES = frozenset({"viewer_widget"})
+
+
+def _runs_headless(item):
+    names = set(getattr(item, "fixturenames", ()))
+    return bool(names & _HEADLESS_FIXTURES) and "gl_viewer_widget" not in names
+
+
 def pytest_configure(config):
     config.addinivalue_line(
         "markers",
@@ -25,7 +79,10 @@ def pytest_configure(config):
 
 
 def pytest_collection_modifyitems(config, items):
-    """In headless CI (no DISPLAY on Linux), skip all tests collected from tests/gui."""
+    """In headless CI (no DISPLAY on Linux), skip tests from tests/gui that need a display.
+
+    Tests built on the headless viewer_widget fixture never create a GL context and still run.
+    """
     if sys.platform != "linux":
         return
     if os.environ.get("DISPLAY"):
@@ -35,7 +92,7 @@ def pytest_collection_modifyitems(config, items):
             path_str = str(item.fspath).replace("\\", "/")
         except Exception:
             continue
-        if "tests/gui" in path_str:
+        if "tests/gui" in path_str and not _runs_headless(item):
             item.add_marker(
                 pytest.mark.skip(reason="Headless: no DISPLAY. Run with: xvfb-run pytest tests/gui")
             )
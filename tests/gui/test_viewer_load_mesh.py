@@ -1,49 +1,41 @@
 """
-Viewer load_mesh tests. Require DISPLAY on Linux (run with: xvfb-run pytest tests/gui).
-Skipped automatically when headless (no DISPLAY).
+Viewer load_mesh tests. They use the headless viewer_widget and also run without DISPLAY;
+GPU-marked tests need a real GL context (run with: xvfb-run pytest tests/gui).
 """
 from pathlib import Path
 
 import pytest
 
-from PySide6.QtWidgets import QApplication
-from mapfree.viewer.gl_widget import set_default_opengl_format, ViewerWidget
-
 
 FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures"
 MESH_PLY = FIXTURES_DIR / "mesh.ply"
-
-
-@pytest.fixture(scope="module")
-def qapp():
-    """Single QApplication for the module; OpenGL format set before first widget."""
-    set_default_opengl_format()
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
-
-
-@pytest.fixture
-def viewer_widget(qapp):
-    """ViewerWidget with GL context realized (show + processEvents)."""
-    widget = ViewerWidget()
-    widget.show()
-    qapp.processEvents()
-    yield widget
-    widget.close()
+MESH_PLY_STR = str(MESH_PLY)
+# Read once; tests hand the bytes to load_mesh so no test reopens the file
+MESH_BYTES = MESH_PLY.read_bytes()
 
 
 def test_load_mesh_success(viewer_widget):
     """load_mesh returns True and widget has vertices and indices for valid PLY mesh."""
-    assert MESH_PLY.exists(), "fixture mesh.ply missing"
-    ok = viewer_widget.load_mesh(str(MESH_PLY))
+    ok = viewer_widget.load_mesh(MESH_BYTES)
     assert ok is True
     assert viewer_widget._num_vertices == 3
     assert viewer_widget._num_indices == 3
 
+    # Batched path: both copies end up in one buffer, indices offset by the first mesh
+    assert viewer_widget.load_many([MESH_PLY_STR, MESH_BYTES]) == [True, True]
+    assert viewer_widget._num_vertices == 6
+    assert viewer_widget._num_indices == 6
+
 
 def test_load_mesh_invalid_path(viewer_widget):
     """load_mesh returns False for non-existent file."""
     ok = viewer_widget.load_mesh("/nonexistent/mesh.ply")
     assert ok is False
+
+
+@pytest.mark.gpu
+def test_load_mesh_real_gl(gl_viewer_widget):
+    """Same load through a realized GL context: buffers are uploaded, counts match."""
+    assert gl_viewer_widget.load_mesh(MESH_BYTES) is True
+    assert gl_viewer_widget._num_vertices == 3
+    assert gl_viewer_widget._num_indices == 3
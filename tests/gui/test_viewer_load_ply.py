@@ -1,43 +1,22 @@
 """
-Viewer load_point_cloud tests. Require DISPLAY on Linux (run with: xvfb-run pytest tests/gui).
-Skipped automatically when headless (no DISPLAY).
+Viewer load_point_cloud tests. They use the headless viewer_widget and also run without DISPLAY;
+GPU-marked tests need a real GL context (run with: xvfb-run pytest tests/gui).
 """
 from pathlib import Path
 
+import numpy as np
 import pytest
 
-from PySide6.QtWidgets import QApplication
-from mapfree.viewer.gl_widget import set_default_opengl_format, ViewerWidget
-
 
 FIXTURES_DIR = Path(__file__).resolve().parent.parent / "fixtures"
 POINT_CLOUD_PLY = FIXTURES_DIR / "point_cloud.ply"
-
-
-@pytest.fixture(scope="module")
-def qapp():
-    """Single QApplication for the module; OpenGL format set before first widget."""
-    set_default_opengl_format()
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
-    yield app
-
-
-@pytest.fixture
-def viewer_widget(qapp):
-    """ViewerWidget with GL context realized (show + processEvents)."""
-    widget = ViewerWidget()
-    widget.show()
-    qapp.processEvents()
-    yield widget
-    widget.close()
+# Read once; tests hand the bytes to load_point_cloud so no test reopens the file
+POINT_CLOUD_BYTES = POINT_CLOUD_PLY.read_bytes()
 
 
 def test_load_point_cloud_success(viewer_widget):
     """load_point_cloud returns True and widget has geometry for valid PLY."""
-    assert POINT_CLOUD_PLY.exists(), "fixture point_cloud.ply missing"
-    ok = viewer_widget.load_point_cloud(str(POINT_CLOUD_PLY))
+    ok = viewer_widget.load_point_cloud(POINT_CLOUD_BYTES)
     assert ok is True
     assert viewer_widget._num_vertices == 3
 
@@ -46,3 +25,22 @@ def test_load_point_cloud_invalid_path(viewer_widget):
     """load_point_cloud returns False for non-existent file."""
     ok = viewer_widget.load_point_cloud("/nonexistent/path.ply")
     assert ok is False
+
+
+@pytest.mark.gpu
+def test_load_point_cloud_above_mapped_upload_threshold(gl_viewer_widget):
+    """A VBO of MAPPED_UPLOAD_MIN_BYTES or more goes through the mapped upload and still loads."""
+    from mapfree.viewer.gl_widget import MAPPED_UPLOAD_MIN_BYTES
+
+    if gl_viewer_widget._use_fallback or gl_viewer_widget._vbo is None:
+        pytest.skip("no OpenGL context on this platform")
+    n = MAPPED_UPLOAD_MIN_BYTES // 24 + 1024  # 6 float32 per vertex (position + color)
+    header = (
+        "ply\nformat binary_little_endian 1.0\n"
+        f"element vertex {n}\n"
+        "property float x\nproperty float y\nproperty float z\nend_header\n"
+    ).encode()
+    xyz = np.random.default_rng(0).random((n, 3), dtype=np.float32)
+    assert gl_viewer_widget.load_point_cloud(header + xyz.astype("<f4").tobytes()) is True
+    assert gl_viewer_widget._num_vertices == n
+    assert gl_viewer_widget._vbo.size() >= MAPPED_UPLOAD_MIN_BYTES
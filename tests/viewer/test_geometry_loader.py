@@ -0,0 +1,300 @@
+"""Tests for mapfree.viewer.geometry_loader (pure numpy; no Qt needed).
+
+Covers ASCII and binary PLY (both byte orders, doubles, extra properties, polygon faces,
+batched vertex packing), OBJ and LAS.
+"""
+import struct
+
+import numpy as np
+import pytest
+
+from mapfree.viewer import geometry_loader
+from mapfree.viewer.geometry_loader import load_las, load_obj, load_ply
+
+_DEFAULT_NORMAL = [0.0, 1.0, 0.0]
+_DEFAULT_COLOR = [0.7, 0.7, 0.7]
+
+
+# ─── helpers ─────────────────────────────────────────────────────────────────
+
+
+def _write_ascii_ply(path, props, rows, faces=()):
+    header = [
+        "ply",
+        "format ascii 1.0",
+        f"element vertex {len(rows)}",
+        *(f"property {kind} {name}" for kind, name in props),
+    ]
+    if faces:
+        header += [f"element face {len(faces)}", "property list uchar int vertex_indices"]
+    header.append("end_header")
+    path.write_text("\n".join(header + list(rows) + list(faces)) + "\n")
+    return path
+
+
+_PLY_TYPES = {"float": "f4", "double": "f8", "uchar": "u1", "int": "i4", "short": "i2"}
+
+
+def _write_binary_ply(path, props, columns, faces=(), big_endian=False):
+    """props: [(ply type, name)], columns: {name: values}; faces: lists of vertex indices."""
+    order = ">" if big_endian else "<"
+    n = len(next(iter(columns.values())))
+    header = [
+        "ply",
+        f"format binary_{'big' if big_endian else 'little'}_endian 1.0",
+        f"element vertex {n}",
+        *(f"property {kind} {name}" for kind, name in props),
+    ]
+    if faces:
+        header += [f"element face {len(faces)}", "property list uchar int vertex_indices"]
+    header.append("end_header")
+    rec = np.empty(n, dtype=[(name, order + _PLY_TYPES[kind]) for kind, name in props])
+    for _, name in props:
+        rec[name] = columns[name]
+    body = rec.tobytes()
+    for face in faces:
+        body += struct.pack(f"{order}B{len(face)}i", len(face), *face)
+    path.write_bytes(("\n".join(header) + "\n").encode() + body)
+    return path
+
+
+_XYZ = [("float", "x"), ("float", "y"), ("float", "z")]
+_TRI = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0]], dtype=np.float32)
+
+
+def _xyz_columns(xyz):
+    xyz = np.asarray(xyz)
+    return {"x": xyz[:, 0], "y": xyz[:, 1], "z": xyz[:, 2]}
+
+
+# ─── ASCII PLY ───────────────────────────────────────────────────────────────
+
+
+def test_ascii_ply_with_colors(tmp_path):
+    ply = _write_ascii_ply(
+        tmp_path / "c.ply",
+        [("float", "x"), ("float", "y"), ("float", "z"),
+         ("uchar", "red"), ("uchar", "green"), ("uchar", "blue")],
+        ["0 0 0 255 0 0", "1 0 0 0 255 0", "0 1 0 0 0 255"],
+        ["3 0 1 2"],
+    )
+    out = load_ply(str(ply))
+    assert out is not None
+    np.testing.assert_allclose(out["positions"], [[0, 0, 0], [1, 0, 0], [0, 1, 0]])
+    np.testing.assert_allclose(out["colors"], np.eye(3))
+    assert out["indices"].tolist() == [0, 1, 2]
+
+
+def test_ascii_ply_skips_ragged_vertex_rows(tmp_path):
+    ply = _write_ascii_ply(
+        tmp_path / "ragged.ply",
+        [("float", "x"), ("float", "y"), ("float", "z")],
+        ["0 0 0", "1 0", "2 2 2", "nan? x y", "0 1 0"],
+    )
+    out = load_ply(str(ply))
+    assert out is not None
+    np.testing.assert_allclose(out["positions"], [[0, 0, 0], [2, 2, 2], [0, 1, 0]])
+    assert out["indices"] is None
+
+
+def test_ascii_ply_all_rows_malformed(tmp_path):
+    ply = _write_ascii_ply(tmp_path / "bad.ply", [("float", "x"), ("float", "y"), ("float", "z")], ["1", "a b c"])
+    assert load_ply(str(ply)) is None
+
+
+# ─── binary PLY ──────────────────────────────────────────────────────────────
+
+
+@pytest.mark.parametrize("big_endian", [False, True])
+def test_binary_ply_normals_colors_and_triangles(tmp_path, big_endian):
+    props = _XYZ + [("float", "nx"), ("float", "ny"), ("float", "nz"),
+                    ("uchar", "red"), ("uchar", "green"), ("uchar", "blue")]
+    cols = _xyz_columns(_TRI)
+    cols.update(nx=[0, 0, 0], ny=[0, 0, 0], nz=[1, 1, 1],
+                red=[255, 0, 0], green=[0, 255, 0], blue=[0, 0, 51])
+    ply = _write_binary_ply(tmp_path / "m.ply", props, cols, faces=[[0, 1, 2]], big_endian=big_endian)
+    out = load_ply(str(ply))
+    assert out is not None
+    np.testing.assert_allclose(out["positions"], _TRI)
+    np.testing.assert_allclose(out["normals"], [[0, 0, 1]] * 3)
+    np.testing.assert_allclose(out["colors"], [[1, 0, 0], [0, 1, 0], [0, 0, 0.2]], rtol=1e-6)
+    assert out["indices"].tolist() == [0, 1, 2]
+    assert out["vbo"].shape == (3, 9)
+
+
+def test_binary_ply_double_coordinates_and_extra_properties(tmp_path):
+    props = [("int", "id"), ("double", "x"), ("double", "y"), ("double", "z"), ("short", "quality")]
+    xyz = np.array([[1.5, -2.25, 1e3], [0.125, 4.0, -7.5]])
+    cols = _xyz_columns(xyz)
+    cols.update(id=[7, 8], quality=[-1, 2])
+    out = load_ply(str(_write_binary_ply(tmp_path / "d.ply", props, cols)))
+    assert out is not None
+    assert out["positions"].dtype == np.float32
+    np.testing.assert_allclose(out["positions"], xyz)
+    np.testing.assert_allclose(out["normals"], [_DEFAULT_NORMAL] * 2)
+    np.testing.assert_allclose(out["colors"], [_DEFAULT_COLOR] * 2)
+    assert out["indices"] is None
+
+
+def test_binary_ply_mixed_polygon_faces(tmp_path):
+    xyz = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0]]
+    faces = [[0, 1, 2, 3], [1, 4, 2]]  # quad then triangle: per-face path, fan triangulation
+    out = load_ply(str(_write_binary_ply(tmp_path / "q.ply", _XYZ, _xyz_columns(xyz), faces=faces)))
+    assert out is not None
+    assert out["indices"].tolist() == [0, 1, 2, 0, 2, 3, 1, 4, 2]
+
+
+def test_binary_ply_float_colors_in_0_255(tmp_path):
+    props = _XYZ + [("float", "red"), ("float", "green"), ("float", "blue")]
+    cols = _xyz_columns(_TRI)
+    cols.update(red=[255, 0, 0], green=[0, 127.5, 0], blue=[0, 0, 0])
+    out = load_ply(str(_write_binary_ply(tmp_path / "fc.ply", props, cols)))
+    np.testing.assert_allclose(out["colors"], [[1, 0, 0], [0, 0.5, 0], [0, 0, 0]], rtol=1e-6)
+
+
+def test_binary_ply_packs_across_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(geometry_loader, "_PLY_VERTEX_BATCH", 2)
+    xyz = np.arange(15, dtype=np.float32).reshape(5, 3)
+    props = _XYZ + [("uchar", "red"), ("uchar", "green"), ("uchar", "blue")]
+    cols = _xyz_columns(xyz)
+    cols.update(red=[0, 51, 102, 153, 255], green=[0] * 5, blue=[255] * 5)
+    out = load_ply(str(_write_binary_ply(tmp_path / "b.ply", props, cols)))
+    np.testing.assert_allclose(out["positions"], xyz)
+    np.testing.assert_allclose(out["colors"][:, 0], [0, 0.2, 0.4, 0.6, 1.0], rtol=1e-6)
+
+
+def test_binary_ply_truncated_body_keeps_complete_vertices(tmp_path):
+    ply = _write_binary_ply(tmp_path / "t.ply", _XYZ, _xyz_columns(_TRI))
+    ply.write_bytes(ply.read_bytes()[:-6])  # last vertex cut in half
+    out = load_ply(str(ply))
+    np.testing.assert_allclose(out["positions"], _TRI[:2])
+
+
+def test_ply_rejects_missing_file_and_wrong_suffix(tmp_path):
+    assert load_ply(str(tmp_path / "missing.ply")) is None
+    other = tmp_path / "mesh.txt"
+    other.write_text("ply\n")
+    assert load_ply(str(other)) is None
+
+
+# ─── OBJ ─────────────────────────────────────────────────────────────────────
+
+
+def test_obj_quad_with_normals(tmp_path):
+    obj = tmp_path / "q.obj"
+    obj.write_text(
+        "# quad\n"
+        "v 0 0 0\nv 1 0 0\nv 1 1 0\nv 0 1 0\n"
+        "vt 0 0\n"
+        "vn 0 0 1\n"
+        "f 1/1/1 2/1/1 3/1/1 4/1/1\n"
+    )
+    out = load_obj(str(obj))
+    assert out is not None
+    np.testing.assert_allclose(out["positions"], [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]])
+    assert out["indices"].tolist() == [0, 1, 2, 0, 2, 3]
+    np.testing.assert_allclose(out["normals"], [[0, 0, 1]] * 4)
+    np.testing.assert_allclose(out["colors"], [_DEFAULT_COLOR] * 4)
+    assert out["ebo"] is out["indices"]
+
+
+def test_obj_splits_vertices_with_different_normals(tmp_path):
+    obj = tmp_path / "s.obj"
+    obj.write_text(
+        "v 0 0 0\nv 1 0 0\nv 0 1 0\nv 0 0 1\n"
+        "vn 0 0 1\nvn 1 0 0\n"
+        "f 1//1 2//1 3//1\n"
+        "f 1//2 3//2 4//2\n"
+    )
+    out = load_obj(str(obj))
+    # Vertices 1 and 3 appear with two different normals -> expanded to 6 vertices
+    assert len(out["positions"]) == 6
+    assert out["indices"].tolist() == [0, 1, 2, 3, 4, 5]
+    np.testing.assert_allclose(out["normals"][:3], [[0, 0, 1]] * 3)
+    np.testing.assert_allclose(out["normals"][3:], [[1, 0, 0]] * 3)
+
+
+def test_obj_faces_without_normals_use_default(tmp_path):
+    obj = tmp_path / "n.obj"
+    obj.write_text("v 0 0 0\nv 1 0 0\nv 0 1 0\nf 1 2 3\n")
+    out = load_obj(str(obj))
+    assert out["indices"].tolist() == [0, 1, 2]
+    np.testing.assert_allclose(out["normals"], [_DEFAULT_NORMAL] * 3)
+
+
+def test_obj_without_vertices_or_faces(tmp_path):
+    empty = tmp_path / "e.obj"
+    empty.write_text("# nothing\n")
+    assert load_obj(str(empty)) is None
+    no_faces = tmp_path / "p.obj"
+    no_faces.write_text("v 0 0 0\nv 1 0 0\n")
+    assert load_obj(str(no_faces)) is None
+
+
+# ─── LAS ─────────────────────────────────────────────────────────────────────
+
+
+def _write_las(path, points, point_format, rgb=None, scale=(0.01, 0.01, 0.01), offset=(0.0, 0.0, 0.0)):
+    """Minimal LAS 1.2 file: 227-byte public header, then point records."""
+    record_length = {0: 20, 1: 28, 2: 26, 3: 34}[point_format]
+    header = bytearray(227)
+    header[0:4] = b"LASF"
+    header[24:26] = bytes([1, 2])
+    struct.pack_into("<H", header, 94, 227)
+    struct.pack_into("<I", header, 96, 227)
+    header[104] = point_format
+    struct.pack_into("<H", header, 105, record_length)
+    struct.pack_into("<I", header, 107, len(points))
+    struct.pack_into("<ddd", header, 131, *scale)
+    struct.pack_into("<ddd", header, 155, *offset)
+    body = bytearray()
+    rgb_offset = {2: 20, 3: 28}.get(point_format)
+    for i, xyz in enumerate(points):
+        rec = bytearray(record_length)
+        struct.pack_into("<iii", rec, 0, *xyz)
+        if rgb_offset is not None:
+            struct.pack_into("<HHH", rec, rgb_offset, *rgb[i])
+        body += rec
+    path.write_bytes(bytes(header) + bytes(body))
+    return path
+
+
+@pytest.mark.parametrize("point_format", [2, 3])
+def test_las_rgb_point_formats(tmp_path, point_format):
+    las = _write_las(
+        tmp_path / "c.las",
+        [(100, 200, 300), (-50, 0, 25)],
+        point_format,
+        rgb=[(65535, 0, 0), (0, 65535, 32768)],
+        offset=(10.0, 20.0, 30.0),
+    )
+    out = load_las(str(las))
+    assert out is not None
+    np.testing.assert_allclose(out["positions"], [[11, 22, 33], [9.5, 20, 30.25]], rtol=1e-6)
+    np.testing.assert_allclose(out["colors"], [[1, 0, 0], [0, 1, 32768 / 65535]], rtol=1e-6)
+    np.testing.assert_allclose(out["normals"], [_DEFAULT_NORMAL] * 2)
+    assert out["indices"] is None and out["ebo"] is None
+    assert out["vbo"].shape == (2, 9)
+
+
+def test_las_without_rgb_uses_default_color(tmp_path):
+    out = load_las(str(_write_las(tmp_path / "g.las", [(1, 2, 3)], 0, scale=(1.0, 1.0, 1.0))))
+    np.testing.assert_allclose(out["positions"], [[1, 2, 3]])
+    np.testing.assert_allclose(out["colors"], [_DEFAULT_COLOR])
+
+
+def test_las_point_count_clipped_to_file_size(tmp_path):
+    las = _write_las(tmp_path / "t.las", [(1, 1, 1), (2, 2, 2)], 0, scale=(1.0, 1.0, 1.0))
+    data = bytearray(las.read_bytes())
+    struct.pack_into("<I", data, 107, 1000)  # header claims far more points than stored
+    las.write_bytes(bytes(data))
+    np.testing.assert_allclose(load_las(str(las))["positions"], [[1, 1, 1], [2, 2, 2]])
+
+
+def test_las_rejects_bad_signature_and_short_file(tmp_path):
+    bad = _write_las(tmp_path / "b.las", [(1, 2, 3)], 0)
+    bad.write_bytes(b"XXXX" + bad.read_bytes()[4:])
+    assert load_las(str(bad)) is None
+    short = tmp_path / "s.las"
+    short.write_bytes(b"LASF" + b"\x00" * 50)
+    assert load_las(str(short)) is None
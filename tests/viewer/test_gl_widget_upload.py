@@ -0,0 +1,67 @@
+"""Tests for the mapped buffer upload in mapfree.viewer.gl_widget (no GL context needed).
+
+A stand-in buffer returns a real shiboken VoidPtr from mapRange, as QOpenGLBuffer does.
+"""
+import ctypes
+
+import numpy as np
+import pytest
+
+pytest.importorskip("PySide6", reason="PySide6 not installed — skipping viewer tests")
+
+from shiboken6 import Shiboken  # noqa: E402
+
+from mapfree.viewer import gl_widget  # noqa: E402
+
+
+class _MappedBuffer:
+    """Minimal QOpenGLBuffer stand-in backed by a ctypes array."""
+
+    def __init__(self, map_ok=True):
+        self._store = None
+        self.map_ok = map_ok
+        self.mapped = False
+
+    def size(self):
+        return len(self._store) if self._store is not None else -1
+
+    def allocate(self, *args):
+        nbytes = args[-1]
+        self._store = (ctypes.c_char * nbytes)()
+        if len(args) == 2:
+            ctypes.memmove(self._store, args[0].ctypes.data, nbytes)
+
+    def write(self, offset, arr, nbytes):
+        ctypes.memmove(ctypes.addressof(self._store) + offset, arr.ctypes.data, nbytes)
+
+    def mapRange(self, offset, nbytes, access):
+        if not self.map_ok:
+            return Shiboken.VoidPtr(0)
+        self.mapped = True
+        return Shiboken.VoidPtr(ctypes.addressof(self._store) + offset)
+
+    def unmap(self):
+        self.mapped = False
+        return True
+
+
+def test_mapped_write_copies_through_voidptr():
+    arr = np.arange(12, dtype=np.float32)
+    buf = _MappedBuffer()
+    assert gl_widget._write_buffer_mapped(buf, arr) is True
+    assert not buf.mapped
+    assert np.array_equal(np.frombuffer(bytes(buf._store), dtype=np.float32), arr)
+
+
+def test_mapped_write_reports_unavailable_mapping():
+    buf = _MappedBuffer(map_ok=False)
+    assert gl_widget._write_buffer_mapped(buf, np.ones(4, dtype=np.float32)) is False
+
+
+def test_write_buffer_uses_mapping_above_threshold(monkeypatch):
+    monkeypatch.setattr(gl_widget, "MAPPED_UPLOAD_MIN_BYTES", 16)
+    arr = np.arange(8, dtype=np.float32)
+    buf = _MappedBuffer()
+    gl_widget._write_buffer(buf, arr)
+    assert not buf.mapped
+    assert np.array_equal(np.frombuffer(bytes(buf._store), dtype=np.float32), arr)
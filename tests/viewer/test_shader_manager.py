@@ -0,0 +1,46 @@
+"""Tests for mapfree.viewer.shader_manager uniform setters (stand-in program, no GL context)."""
+import pytest
+
+pytest.importorskip("PySide6", reason="PySide6 not installed — skipping viewer tests")
+
+from PySide6.QtGui import QMatrix4x4  # noqa: E402
+
+from mapfree.viewer.shader_manager import ShaderManager, _init_normal_matrix  # noqa: E402
+
+
+class _Program:
+    """Records setUniformValue calls like a bound, linked QOpenGLShaderProgram."""
+
+    def __init__(self):
+        self.uniforms = {}
+
+    def isLinked(self):
+        return True
+
+    def bind(self):
+        return True
+
+    def release(self):
+        pass
+
+    def setUniformValue(self, name, value):
+        self.uniforms[name] = value
+
+
+def test_normal_matrix_starts_at_identity():
+    prog = _Program()
+    _init_normal_matrix(prog)
+    assert prog.uniforms["uNormalMatrix"] == QMatrix4x4().normalMatrix()
+
+
+def test_set_mesh_model_uploads_normal_matrix():
+    prog = _Program()
+    model = QMatrix4x4()
+    model.scale(2.0, 1.0, 1.0)
+    ShaderManager().set_mesh_model(model, prog)
+    assert prog.uniforms["uModel"] == model
+    assert prog.uniforms["uNormalMatrix"] == model.normalMatrix()
+
+
+def test_set_mesh_model_without_program_is_noop():
+    ShaderManager().set_mesh_model(QMatrix4x4())